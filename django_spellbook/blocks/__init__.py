@@ -1,8 +1,3 @@
-from typing import Set
-
-# render to string
-from django.template.loader import render_to_string
-
 from .base import BasicSpellBlock
 from .registry import SpellBlockRegistry
 
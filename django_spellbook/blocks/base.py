@@ -1,7 +1,9 @@
-from typing import Dict, Any, Set, Optional
-from django.template.loader import render_to_string
-from django.template.exceptions import TemplateDoesNotExist
-import markdown
+from functools import lru_cache
+from typing import Dict, Any, Iterable, List, Set, Optional
+from django.core.signals import setting_changed
+from django.dispatch import receiver
+from django.template.loader import get_template
+from django.utils.autoreload import file_changed
 from logging import getLogger
 
 from django_spellbook.management.commands.spellbook_md_p.reporter import MarkdownReporter
@@ -9,19 +11,48 @@ from django_spellbook.management.commands.spellbook_md_p.reporter import Markdow
 
 logger = getLogger(__name__)
 
+# django_spellbook.parsers imports this module (through the engine), so it is
+# imported on first use and kept here instead of re-importing on every render.
+_parsers = None
+
+
+def _get_parsers():
+    """Return the django_spellbook.parsers module, importing it once."""
+    global _parsers
+    if _parsers is None:
+        from django_spellbook import parsers
+        _parsers = parsers
+    return _parsers
+
+
+@lru_cache(maxsize=512)
+def _render_plain_markdown(content: str) -> str:
+    """
+    Render markdown that contains no SpellBlocks with the default engine.
+
+    The output depends only on the text, so repeated fragments are memoized.
+    """
+    return _get_parsers().spellbook_render(content)
+
+
 class BasicSpellBlock:
     """
     Base class for spell blocks that render markdown content with specific templates.
     Now uses the custom MarkdownParser for more consistent processing.
     """
 
+    # Defaults for the metadata subclasses override as class attributes
+    name: Optional[str] = None
+    template: Optional[str] = None
+    required_kwargs: Set[str] = frozenset()
+    optional_kwargs: Set[str] = frozenset()
+
+    # Resolved templates keyed by template name, shared by all blocks
+    _template_cache: Dict[str, Any] = {}
+
     def __init__(self, reporter: MarkdownReporter, content=None, spellbook_parser=None, **kwargs):
         self.content = content
         self.kwargs = kwargs
-        self.name = getattr(self, 'name', None)
-        self.template = getattr(self, 'template', None)
-        self.required_kwargs = getattr(self, 'required_kwargs', set())
-        self.optional_kwargs = getattr(self, 'optional_kwargs', set())
         self.reporter = reporter
         self.spellbook_parser = spellbook_parser # for nested parsing
 
@@ -29,10 +60,9 @@ class BasicSpellBlock:
         """
         Get the context dictionary for template rendering.
         """
-        return {
-            'content': self.process_content(),
-            **self.kwargs
-        }
+        context = {'content': self.process_content()}
+        context.update(self.kwargs)
+        return context
 
     def process_content(self) -> str:
         """
@@ -42,12 +72,17 @@ class BasicSpellBlock:
         if self.content is None:
             return ''
 
-        from django_spellbook.parsers import render_spellbook_markdown_to_html
-        return render_spellbook_markdown_to_html(
-            self.content, 
-            self.reporter, 
-            self.spellbook_parser
-            )
+        # Reuse the engine that is rendering this block so nested content shares
+        # its already-configured markdown extensions instead of building a new
+        # engine (and extension list) for every block.
+        if self.spellbook_parser is not None:
+            return self.spellbook_parser.parse_and_render(self.content)
+
+        # Nested SpellBlocks report their usage, so only plain markdown is memoized
+        if '{~' not in self.content:
+            return _render_plain_markdown(self.content)
+
+        return _get_parsers().spellbook_render(self.content, self.reporter)
 
     def render(self) -> str:
         """
@@ -57,4 +92,44 @@ class BasicSpellBlock:
             raise ValueError(f"No template specified for block {self.name}")
         context = self.get_context()
         self.reporter.record_spellblock_usage(self.name, success=True, params=context)
-        return render_to_string(self.template, context)
+        return self.get_template().render(context)
+
+    @classmethod
+    def render_many(cls, blocks: Iterable['BasicSpellBlock']) -> List[str]:
+        """
+        Render several blocks, sharing one markdown engine per reporter.
+
+        Blocks created without a parent engine would otherwise each build their
+        own engine for nested content; here they are attached to a shared one.
+        Templates come from the shared template cache.
+        """
+        from django_spellbook.markdown.engine import SpellbookMarkdownEngine
+
+        engines = {}
+        rendered = []
+        for block in blocks:
+            if block.spellbook_parser is None:
+                engine = engines.get(id(block.reporter))
+                if engine is None:
+                    engine = SpellbookMarkdownEngine(reporter=block.reporter)
+                    engines[id(block.reporter)] = engine
+                block.spellbook_parser = engine
+            rendered.append(block.render())
+        return rendered
+
+    def get_template(self):
+        """
+        Get the block's template, resolving it through the loaders only once.
+        """
+        template = BasicSpellBlock._template_cache.get(self.template)
+        if template is None:
+            template = get_template(self.template)
+            BasicSpellBlock._template_cache[self.template] = template
+        return template
+
+
+@receiver(setting_changed)
+@receiver(file_changed)
+def _clear_template_cache(**kwargs):
+    """Drop resolved block templates when settings or template files change."""
+    BasicSpellBlock._template_cache.clear()
@@ -1,11 +1,10 @@
-from typing import Dict, Type, Optional
-import importlib
+from typing import Dict, List, Tuple, Type, Optional
 import logging
-from django.apps import apps
 from .base import BasicSpellBlock
 from .exceptions import BlockRegistrationError
 
 logger = logging.getLogger(__name__)
+logger.addHandler(logging.NullHandler())
 
 
 class SpellBlockRegistry:
@@ -38,35 +37,41 @@ class SpellBlockRegistry:
                 - Other registration errors
         """
         def decorator(block_class: Type[BasicSpellBlock]):
+            class_name = getattr(block_class, '__name__', repr(block_class))
+
+            def registration_error(message: str) -> BlockRegistrationError:
+                logger.error("Error registering block %s: %s", class_name, message)
+                return BlockRegistrationError(message)
+
+            # Validate the block class
+            if BasicSpellBlock not in getattr(block_class, '__mro__', ()):
+                raise registration_error(
+                    f"Block class {class_name} must inherit from BasicSpellBlock"
+                )
+
+            # Get the block name
+            block_name = name or getattr(block_class, 'name', None)
+            if not block_name:
+                raise registration_error(
+                    f"Block class {class_name} must have a name"
+                )
+
+            # Check for name conflicts
             try:
-                # Validate the block class
-                if not issubclass(block_class, BasicSpellBlock):
-                    raise BlockRegistrationError(
-                        f"Block class {block_class.__name__} must inherit from BasicSpellBlock"
-                    )
-
-                # Get the block name
-                block_name = name or getattr(block_class, 'name', None)
-                if not block_name:
-                    raise BlockRegistrationError(
-                        f"Block class {block_class.__name__} must have a name"
-                    )
-
-                # Check for name conflicts
-                if block_name in cls._registry:
-                    raise BlockRegistrationError(
-                        f"Multiple blocks registered with name '{block_name}'"
-                    )
-
-                # Register the block
-                cls._registry[block_name] = block_class
-                logger.debug(f"Successfully registered block: {block_name}")
-                return block_class
-
-            except Exception as e:
-                logger.error(
-                    f"Error registering block {block_class.__name__}: {str(e)}")
-                raise BlockRegistrationError(str(e))
+                is_registered = block_name in cls._registry
+            except TypeError as e:
+                raise registration_error(
+                    f"Block name {block_name!r} must be hashable"
+                ) from e
+            if is_registered:
+                raise registration_error(
+                    f"Multiple blocks registered with name '{block_name}'"
+                )
+
+            # Register the block
+            cls._registry[block_name] = block_class
+            logger.debug("Successfully registered block: %s", block_name)
+            return block_class
         return decorator
 
     @classmethod
@@ -81,4 +86,14 @@ class SpellBlockRegistry:
             Optional[Type[BasicSpellBlock]]: The registered block class if found, None otherwise.
         """
 
-        return cls._registry.get(name)
\ No newline at end of file
+        return cls._registry.get(name)
+
+    @classmethod
+    def all_blocks(cls) -> List[Tuple[str, Type[BasicSpellBlock]]]:
+        """
+        Get every registered block in registration order.
+
+        Returns:
+            List[Tuple[str, Type[BasicSpellBlock]]]: (name, block class) pairs.
+        """
+        return list(cls._registry.items())
@@ -1,15 +1,33 @@
 # django_spellbook/management/commands/command_utils.py
 
 import os
+import re
 import logging
+from functools import lru_cache
 from typing import List, Tuple, Optional, IO, Set
 from pathlib import Path
 
 from django.core.management.base import CommandError
+from django.core.signals import setting_changed
 from django.conf import settings
+from django.dispatch import receiver
+from django.template import TemplateDoesNotExist
+from django.template.loader import get_template
 
 logger = logging.getLogger(__name__)
 
+_URL_PREFIX_RE = re.compile(r'^[a-zA-Z0-9_\-]+$')
+
+# Substrings that are never allowed in URL prefixes or base template paths
+_DANGEROUS_PREFIX = ('..', '//', '<?', '%', '\x00')
+_DANGEROUS_TEMPLATE = (
+    '..', '//', '\\', '<', '>', '%', '\x00',
+    ':', '&', ';', '$', '|', '?', '#', '*', '(', ')',
+    '`touch ', '`rm -rf /`',
+)
+_DANGEROUS_PREFIX_RE = re.compile('|'.join(map(re.escape, _DANGEROUS_PREFIX)))
+_DANGEROUS_TEMPLATE_RE = re.compile('|'.join(map(re.escape, _DANGEROUS_TEMPLATE)))
+
 def normalize_settings(setting_path, setting_app, setting_base_template):
     """
     Convert settings to normalized lists with backward compatibility.
@@ -25,17 +43,15 @@ def normalize_settings(setting_path, setting_app, setting_base_template):
     md_paths: List[str] = [setting_path] if isinstance(setting_path, (str, Path)) else setting_path
     md_apps: List[str] = [setting_app] if isinstance(setting_app, str) else setting_app
     
+    app_count = len(md_apps) if md_apps else 0
+
     # Normalize base_templates to a list
     if setting_base_template is None:
         # Use built-in sidebar template as default for better out-of-box experience
-        default_template = 'django_spellbook/bases/sidebar_left.html'
-        if md_apps:
-            base_templates = [default_template] * len(md_apps)
-        else:
-            base_templates = [default_template]
+        base_templates = ['django_spellbook/bases/sidebar_left.html'] * (app_count or 1)
     elif isinstance(setting_base_template, str):
         # If a string, use the same template for all sources
-        base_templates = [setting_base_template] * len(md_apps)
+        base_templates = [setting_base_template] * app_count
     else:
         # Assume it's already a list
         base_templates = setting_base_template
@@ -46,10 +62,28 @@ def validate_spellbook_settings():
     """
     Validate required settings and support multiple source-destination pairs.
 
+    The validated settings are cached until Django reports a settings change,
+    so repeated calls within a process don't re-run the validation.
+
     Returns:
         Tuple[List[str], List[str], List[str], List[Optional[str]], List[Optional[str]]]:
         md_paths, md_apps, md_url_prefix, base_templates, extend_from_templates.
     """
+    return tuple(list(values) for values in _load_spellbook_settings())
+
+@receiver(setting_changed)
+def _clear_spellbook_settings_cache(**kwargs):
+    """Drop the cached spellbook settings when any setting changes."""
+    _load_spellbook_settings.cache_clear()
+
+@lru_cache(maxsize=1)
+def _load_spellbook_settings():
+    """
+    Read, normalize and validate the spellbook settings.
+
+    Returns:
+        Tuple of tuples in the same order as validate_spellbook_settings().
+    """
     # Get settings values with backward compatibility
     md_path = getattr(settings, 'SPELLBOOK_MD_PATH', None)
     md_app = getattr(settings, 'SPELLBOOK_MD_APP', None)
@@ -67,9 +101,7 @@ def validate_spellbook_settings():
         raise CommandError("Missing required settings: SPELLBOOK_MD_APP or SPELLBOOK_CONTENT_APP")
 
     # Normalize extend_from to list (after content_apps validation)
-    if md_extend_from is None:
-        extend_from_templates = [None] * len(content_apps)
-    elif isinstance(md_extend_from, str):
+    if md_extend_from is None or isinstance(md_extend_from, str):
         extend_from_templates = [md_extend_from] * len(content_apps)
     else:
         extend_from_templates = md_extend_from
@@ -88,7 +120,10 @@ def validate_spellbook_settings():
     _validate_base_templates(base_templates)
     _validate_extend_from_setting(extend_from_templates, content_apps)
 
-    return md_file_paths, content_apps, md_url_prefixes, base_templates, extend_from_templates
+    return tuple(
+        tuple(values) for values in
+        (md_file_paths, content_apps, md_url_prefixes, base_templates, extend_from_templates)
+    )
 
 def _validate_setting_values(md_file_paths: List[str], content_apps: List[str], md_url_prefix: List[str], base_templates: List[Optional[str]]):
     """
@@ -121,8 +156,8 @@ def _validate_setting_values(md_file_paths: List[str], content_apps: List[str],
     if len(base_templates) != len(content_apps):
         raise CommandError("SPELLBOOK_MD_BASE_TEMPLATE and SPELLBOOK_MD_APP must have the same number of entries")
     
-    # Ensure each string is not empty
-    for md_path in md_file_paths:
+    # Ensure each string is not empty (lengths match, so pair them up)
+    for md_path, app_setting in zip(md_file_paths, content_apps):
         if not md_path:
             raise CommandError(
                 "Invalid SPELLBOOK_MD_PATH configuration!\n"
@@ -131,7 +166,6 @@ def _validate_setting_values(md_file_paths: List[str], content_apps: List[str],
                 "are non-empty strings\n"
                 "Documentation: https://django-spellbook.org/docs/settings/"
             )
-    for app_setting in content_apps:
         if not app_setting:
             raise CommandError("SPELLBOOK_MD_APP must be a non-empty string.")
 
@@ -139,20 +173,8 @@ def _validate_setting_values(md_file_paths: List[str], content_apps: List[str],
     # Check if each app exists in INSTALLED_APPS (including AppConfig format like 'app.apps.AppConfig')
     # Skip validation if TESTING flag is set (used in tests to avoid module import errors)
     if not getattr(settings, 'TESTING', False):
-        installed_apps = getattr(settings, 'INSTALLED_APPS', [])
-        missing_apps = []
-
-        for app in content_apps:
-            # Check if app is directly in INSTALLED_APPS or as part of an AppConfig path
-            app_found = False
-            for installed_app in installed_apps:
-                # Match exact app name or app config pattern like 'app.apps.AppConfig'
-                if installed_app == app or installed_app.startswith(f'{app}.'):
-                    app_found = True
-                    break
-
-            if not app_found:
-                missing_apps.append(app)
+        known_apps = _installed_app_names(getattr(settings, 'INSTALLED_APPS', []))
+        missing_apps = [app for app in content_apps if app not in known_apps]
 
         if missing_apps:
             missing_apps_list = '\n  - '.join(missing_apps)
@@ -169,14 +191,35 @@ def _validate_setting_values(md_file_paths: List[str], content_apps: List[str],
     # Validate URL prefixes
     for prefix in md_url_prefix:
         # Check for dangerous patterns
-        dangerous_patterns = ['..', '//', '<?', '%', '\x00']
-        if any(pattern in prefix for pattern in dangerous_patterns):
+        if _DANGEROUS_PREFIX_RE.search(prefix):
             raise CommandError(f"URL prefix '{prefix}' contains invalid characters.")
 
         # Check for invalid URL characters
-        import re
-        if prefix and not re.match(r'^[a-zA-Z0-9_\-]+$', prefix):
-            logger.warning(f"URL prefix '{prefix}' contains characters that may cause issues with URL routing.")
+        if prefix and not _URL_PREFIX_RE.match(prefix):
+            logger.warning(
+                "URL prefix '%s' contains characters that may cause issues with URL routing.", prefix
+            )
+
+def _installed_app_names(installed_apps: List[str]) -> Set[str]:
+    """
+    Collect every name a content app may match in INSTALLED_APPS.
+
+    An app matches an entry exactly or as a dotted prefix of it, so
+    'blog' matches 'blog.apps.BlogConfig'. Each entry contributes all of
+    its dotted prefixes, turning the lookup into a set membership test.
+
+    Args:
+        installed_apps (List[str]): The INSTALLED_APPS setting.
+
+    Returns:
+        Set[str]: Installed app names and their dotted prefixes.
+    """
+    names = set()
+    for installed_app in installed_apps:
+        parts = installed_app.split('.')
+        for end in range(1, len(parts) + 1):
+            names.add('.'.join(parts[:end]))
+    return names
 
 def _validate_extend_from_setting(extend_from: List[Optional[str]], content_apps: List[str]):
     """
@@ -197,11 +240,8 @@ def _validate_extend_from_setting(extend_from: List[Optional[str]], content_apps
             f"Use None for apps using standalone Spellbook."
         )
 
-    # Validate each non-None template
-    from django.template.loader import get_template
-    from django.template import TemplateDoesNotExist
-
-    for i, template_path in enumerate(extend_from):
+    # Validate each distinct non-None template once, even if shared by several apps
+    for template_path in dict.fromkeys(extend_from):
         if template_path is None:
             continue
 
@@ -230,12 +270,7 @@ def _validate_base_templates(base_templates: List[Optional[str]]):
                 raise CommandError(f"Base template '{template}' must be None or a string.")
             
             # Check for dangerous template path patterns
-            dangerous_patterns = [
-                '..', '//', '\\', '<', '>', '%', '\x00', 
-                ':', '&', ';', '$', '|', '?', '#', '*', '(', ')',
-                '`touch ', '`rm -rf /`'
-                ]
-            if any(pattern in template for pattern in dangerous_patterns):
+            if _DANGEROUS_TEMPLATE_RE.search(template):
                 raise CommandError(
                     f"Base template path '{template}' contains potentially dangerous characters.\n"
                     "Avoid path traversal sequences and special characters in template paths."
@@ -263,13 +298,13 @@ def setup_directory_structure(content_app: str, dirpath: str):
         CommandError: If the content app is not found in the directory.
     """
     try:
-        base_path = "/".join(dirpath.split("/")[:-1])
-        content_app_path = os.path.join(base_path, content_app)
+        base_path = Path(dirpath).parent
+        content_app_path = base_path / content_app
 
-        if not os.path.exists(content_app_path):
+        if not content_app_path.is_dir():
             raise CommandError(f"Content app {content_app} not found in {base_path}")
 
-        content_dir_path = content_app_path
+        content_dir_path = str(content_app_path)
         template_dir = setup_template_directory(content_dir_path, content_app)
 
         return content_dir_path, template_dir
@@ -308,24 +343,15 @@ def get_folder_list(dirpath: str, md_file_path: str):
     Returns:
         List[str]: List of folders.
     """
-    logger.debug(f"Getting folder list for: {dirpath}")
-    folder_split = dirpath.split("/")
-    folder_list = []
-
-    # trackers
-    done = False
-    n = -1
-    while not done:
-        dirname = folder_split[n]
-        logger.debug(f"Processing dirname: {dirname}")
-        if dirname == str(md_file_path).split("/")[-1]:
-            done = True
-            break
-        else:
-            folder_list.append(dirname)
-            n -= 1
+    logger.debug("Getting folder list for: %s", dirpath)
+    parts = Path(dirpath).parts
+    md_leaf = Path(md_file_path).name
+
+    # Folders below the last component matching the source directory, innermost first
+    source_index = len(parts) - 1 - parts[::-1].index(md_leaf)
+    folder_list = list(parts[:source_index:-1])
 
-    logger.debug(f"Generated folder list: {folder_list}")
+    logger.debug("Generated folder list: %s", folder_list)
     return folder_list
 
 def log_and_write(message: str, level: str = 'info', stdout: Optional[IO] = None) -> None:
@@ -353,8 +379,7 @@ def normalize_url_prefix(prefix: str) -> str:
         str: Normalized URL prefix
     """
     # Remove leading and trailing slashes
-    prefix = prefix.strip('/')
-    return prefix
+    return prefix.strip('/')
 
 def normalize_url_prefixes(setting_url_prefix) -> List[str]:
     """
@@ -369,8 +394,8 @@ def normalize_url_prefixes(setting_url_prefix) -> List[str]:
     if setting_url_prefix is None:
         return []
     elif isinstance(setting_url_prefix, str):
-        return [normalize_url_prefix(setting_url_prefix)]
+        return [setting_url_prefix.strip('/')]
     else:
-        return [normalize_url_prefix(p) for p in setting_url_prefix]
+        return [p.strip('/') for p in setting_url_prefix]
 
 
@@ -1,3 +1,5 @@
+import os
+from functools import lru_cache
 from pathlib import Path
 from typing import Optional
 
@@ -22,9 +24,21 @@ class SpellbookBaseGenerator:
             extend_from: User's base template path to extend from (or None)
         """
         self.content_app = content_app
-        self.template_dir = template_dir
+        self.template_dir = Path(template_dir)
         self.extend_from = extend_from
-        self.output_path = template_dir / 'spellbook_base.html'
+        self.output_path = self.template_dir / 'spellbook_base.html'
+        self.relative_template = f'{content_app}/spellbook_base.html'
+
+    @classmethod
+    @lru_cache(maxsize=1)
+    def _skeleton(cls) -> str:
+        """
+        Read the skeleton template once; it ships with the package and never changes.
+
+        Returns:
+            str: Contents of the skeleton template
+        """
+        return cls.SKELETON_PATH.read_text()
 
     def process(self) -> Optional[str]:
         """
@@ -47,19 +61,27 @@ class SpellbookBaseGenerator:
             str: Relative path to the generated template
         """
         # Read skeleton template
-        skeleton = self.SKELETON_PATH.read_text()
+        skeleton = self._skeleton()
 
         # Replace placeholder with actual template path
         content = skeleton.replace('__EXTEND_FROM__', self.extend_from)
 
         # Ensure directory exists
-        self.output_path.parent.mkdir(parents=True, exist_ok=True)
+        self.template_dir.mkdir(parents=True, exist_ok=True)
 
-        # Write generated file
-        self.output_path.write_text(content)
+        # Write to a sibling temp file and swap it in, so the template loader
+        # never sees a partially written file
+        tmp_path = self.output_path.with_name(self.output_path.name + '.tmp')
+        try:
+            tmp_path.write_bytes(content.encode('utf-8'))
+            os.replace(tmp_path, self.output_path)
+        except OSError:
+            # Don't leave a stray temp file in the templates directory
+            tmp_path.unlink(missing_ok=True)
+            raise
 
         # Return relative path for template inheritance
-        return f'{self.content_app}/spellbook_base.html'
+        return self.relative_template
 
     def _cleanup(self) -> None:
         """
@@ -68,6 +90,5 @@ class SpellbookBaseGenerator:
         Returns:
             None
         """
-        if self.output_path.exists():
-            self.output_path.unlink()
+        self.output_path.unlink(missing_ok=True)
         return None
@@ -1,15 +1,20 @@
 # django_spellbook/management/commands/processing/directory_index.py
 
 import logging
-from pathlib import Path
-from typing import List, Dict, Tuple, Optional
-from collections import defaultdict
+import os
+from datetime import datetime
+from functools import lru_cache
+from operator import itemgetter
+from typing import List, Dict, Set, Tuple, Optional
 
 from django_spellbook.management.commands.processing.file_processor import ProcessedFile
 from django_spellbook.management.commands.processing.generator_utils import get_clean_url
 
 logger = logging.getLogger(__name__)
 
+# Directory name words that are shown in upper case rather than capitalized
+_ACRONYMS = frozenset({'API', 'FAQ', 'TOC', 'URL', 'HTML', 'CSS', 'JS'})
+
 
 class DirectoryIndexBuilder:
     """
@@ -29,6 +34,15 @@ class DirectoryIndexBuilder:
         """
         self.content_app = content_app
         self.url_prefix = url_prefix.strip('/')
+        self._prefix_slash = f'{self.url_prefix}/' if self.url_prefix else ''
+
+        # These depend only on their argument and the settings above, and are
+        # called repeatedly with the same directories and pages, so memoize
+        # them for the lifetime of this builder
+        self._build_directory_url = lru_cache(maxsize=None)(self._build_directory_url)
+        self._build_page_url = lru_cache(maxsize=None)(self._build_page_url)
+        self._humanize_directory_name = lru_cache(maxsize=None)(self._humanize_directory_name)
+        self._generate_view_name = lru_cache(maxsize=None)(self._generate_view_name)
 
     def build_indexes(
         self,
@@ -47,26 +61,31 @@ class DirectoryIndexBuilder:
             logger.debug("No processed files to build directory indexes from")
             return [], []
 
-        # Group files by directory
-        directory_groups = self._group_by_directory(processed_files)
+        # Group files by directory, noting directories whose URL a file already
+        # claims, then count subdirectory pages and find each subtree's latest
+        # date in one pass each
+        conflicted = set()
+        directory_groups = self._group_by_directory(processed_files, conflicted)
+        subdirectory_index = self._index_subdirectories(directory_groups)
+        latest_dates = self._index_latest_dates(directory_groups)
 
         view_functions = []
         url_patterns = []
 
         for directory, files in directory_groups.items():
             # Skip if directory has URL conflict with existing file
-            if self._has_index_conflict(directory, files):
-                logger.debug(f"Skipping index for {directory} - URL conflict with existing file")
+            if directory in conflicted:
+                logger.debug("Skipping index for %s - URL conflict with existing file", directory)
                 continue
 
             # Skip empty directories (shouldn't happen, but safety check)
             if not files:
-                logger.debug(f"Skipping index for {directory} - no files")
+                logger.debug("Skipping index for %s - no files", directory)
                 continue
 
             # Collect directory context
             context_data = self._collect_directory_context(
-                directory, files, processed_files
+                directory, files, processed_files, subdirectory_index, directory_groups, latest_dates
             )
 
             # Generate view function and URL pattern
@@ -76,45 +95,140 @@ class DirectoryIndexBuilder:
             view_functions.append(view_func)
             url_patterns.append(url_pattern)
 
-            logger.debug(f"Generated index for {directory} with {len(context_data['pages'])} pages and {len(context_data['subdirectories'])} subdirectories")
+            logger.debug(
+                "Generated index for %s with %d pages and %d subdirectories",
+                directory, len(context_data['pages']), len(context_data['subdirectories'])
+            )
 
-        logger.info(f"Generated {len(view_functions)} directory index views")
+        logger.info("Generated %d directory index views", len(view_functions))
         return view_functions, url_patterns
 
     def _group_by_directory(
         self,
-        processed_files: List[ProcessedFile]
-    ) -> Dict[Path, List[ProcessedFile]]:
+        processed_files: List[ProcessedFile],
+        conflicts: Optional[Set[str]] = None
+    ) -> Dict[str, List[ProcessedFile]]:
         """
         Group processed files by their parent directory.
 
+        Directories are '/'-separated strings relative to the content root,
+        with '' for the root itself.
+
         Args:
             processed_files: List of processed markdown files
+            conflicts: Optional set that collects directories whose index URL
+                is claimed by one of their own files (see _has_index_conflict)
 
         Returns:
             Dictionary mapping directory path to list of files in that directory
         """
-        groups = defaultdict(list)
+        groups = {}
 
         for pf in processed_files:
             # Use relative_url to determine directory structure
             # This ensures we work with content-relative paths, not absolute filesystem paths
-            relative_url = pf.relative_url.strip('/')
-
-            if '/' in relative_url:
-                # File is in a subdirectory - get parent directory from URL
-                parent_dir = Path('/'.join(relative_url.split('/')[:-1]))
-            else:
-                # File is at root
-                parent_dir = Path('.')
+            directory = self._file_directory(pf)
+            group = groups.get(directory)
+            if group is None:
+                groups[directory] = group = []
+            group.append(pf)
 
-            groups[parent_dir].append(pf)
+            if (conflicts is not None and directory not in conflicts
+                    and self._claims_directory_url(pf, directory)):
+                conflicts.add(directory)
 
         return groups
 
+    def _index_subdirectories(
+        self,
+        directory_groups: Dict[str, List[ProcessedFile]]
+    ) -> Dict[str, Dict[str, int]]:
+        """
+        Count pages below each immediate child of every directory.
+
+        Args:
+            directory_groups: Result of _group_by_directory()
+
+        Returns:
+            Dictionary mapping directory path to {child name: page count},
+            where the count includes pages nested at any depth below the child
+        """
+        index = {}
+
+        for directory, files in directory_groups.items():
+            if not directory:
+                continue
+
+            # Credit the directory's pages to each ancestor's child on the way down
+            page_count = len(files)
+            parent = ''
+            for child in directory.split('/'):
+                counts = index.get(parent)
+                if counts is None:
+                    index[parent] = counts = {}
+                counts[child] = counts.get(child, 0) + page_count
+                parent = f'{parent}/{child}' if parent else child
+
+        return index
+
+    def _index_latest_dates(
+        self,
+        directory_groups: Dict[str, List[ProcessedFile]]
+    ) -> Dict[str, datetime]:
+        """
+        Find the most recent page date below every directory.
+
+        Args:
+            directory_groups: Result of _group_by_directory()
+
+        Returns:
+            Dictionary mapping directory path to the latest modified (or
+            published) date of any page in it or nested below it; directories
+            without dated pages are left out
+        """
+        latest = {}
+
+        for directory, files in directory_groups.items():
+            group_latest = None
+            for pf in files:
+                # Track most recent modified/published date
+                # Fall back to published if modified not available
+                page_date = getattr(pf.context, 'modified', None) or getattr(pf.context, 'published', None)
+                if page_date:
+                    if group_latest is None or page_date > group_latest:
+                        group_latest = page_date
+
+            if group_latest is None:
+                continue
+
+            # Credit the date to the directory and each of its ancestors
+            ancestor = directory
+            while True:
+                current = latest.get(ancestor)
+                if current is None or group_latest > current:
+                    latest[ancestor] = group_latest
+                if not ancestor:
+                    break
+                ancestor = ancestor.rpartition('/')[0]
+
+        return latest
+
+    @staticmethod
+    def _file_directory(pf: ProcessedFile) -> str:
+        """
+        Get the directory of a processed file from its relative URL.
+
+        Args:
+            pf: Processed markdown file
+
+        Returns:
+            '/'-separated directory path, or '' for files at the root
+        """
+        return pf.relative_url.strip('/').rpartition('/')[0]
+
     def _has_index_conflict(
         self,
-        directory: Path,
+        directory: str,
         files: List[ProcessedFile]
     ) -> bool:
         """
@@ -130,21 +244,23 @@ class DirectoryIndexBuilder:
         Returns:
             True if conflict exists, False if safe to generate index
         """
-        # Build expected directory URL
-        dir_url = self._build_directory_url(directory).rstrip('/')
+        return any(self._claims_directory_url(pf, directory) for pf in files)
 
-        # Check if any file claims this exact URL
-        for pf in files:
-            # Build the full URL for this file
-            file_url = self._build_page_url(pf.relative_url).rstrip('/')
+    def _claims_directory_url(self, pf: ProcessedFile, directory: str) -> bool:
+        """
+        Check if a file's page URL is the same as the directory's index URL.
 
-            if file_url == dir_url:
-                # File claims the directory URL (likely index.md or similar)
-                return True
+        Args:
+            pf: Processed markdown file
+            directory: Directory path
 
-        return False
+        Returns:
+            True if the file claims the directory URL (likely index.md or similar)
+        """
+        return (self._build_page_url(pf.relative_url).rstrip('/')
+                == self._build_directory_url(directory).rstrip('/'))
 
-    def _build_directory_url(self, directory: Path) -> str:
+    def _build_directory_url(self, directory: str) -> str:
         """
         Build URL path for a directory.
 
@@ -158,16 +274,12 @@ class DirectoryIndexBuilder:
             Does NOT include url_prefix because the Django URLs are included
             at the prefix level (e.g., path('content/', include('urls_cornerstone')))
         """
-        # Convert Path to relative URL parts
-        parts = []
+        # Directory parts relative to source root (none for the root itself)
+        parts = directory.split('/') if directory else []
 
-        # Add directory parts (relative to source root)
-        if directory != Path('.'):
-            parts.extend(directory.parts)
-
-            # Remove url_prefix if it's the first part (avoid duplication)
-            if self.url_prefix and parts and parts[0] == self.url_prefix:
-                parts = parts[1:]
+        # Remove url_prefix if it's the first part (avoid duplication)
+        if self.url_prefix and parts and parts[0] == self.url_prefix:
+            parts = parts[1:]
 
         # Build URL with trailing slash (no leading slash for Django path())
         if parts:
@@ -178,7 +290,22 @@ class DirectoryIndexBuilder:
 
         return url
 
-    def _get_parent_directory_info(self, directory: Path) -> Tuple[Optional[str], Optional[str]]:
+    def _add_url_prefix(self, url: str) -> str:
+        """
+        Prefix a relative URL with url_prefix for absolute navigation links.
+
+        Args:
+            url: URL from _build_directory_url() or _build_page_url()
+
+        Returns:
+            URL starting with url_prefix (unchanged if already prefixed or
+            if there is no prefix); the root becomes just the prefix
+        """
+        if not self._prefix_slash or url.startswith(self._prefix_slash):
+            return url
+        return self._prefix_slash + url
+
+    def _get_parent_directory_info(self, directory: str) -> Tuple[Optional[str], Optional[str]]:
         """
         Get parent directory URL and name for "Back to" navigation.
 
@@ -188,23 +315,18 @@ class DirectoryIndexBuilder:
         Returns:
             Tuple of (parent_dir_url, parent_dir_name) or (None, None) if at root
         """
-        if directory == Path('.'):
+        if not directory:
             # At root, no parent
             return None, None
 
         # Get parent directory
-        parent = directory.parent
+        parent = directory.rpartition('/')[0]
 
         # Build parent URL
         parent_url = self._build_directory_url(parent)
 
         # Add url_prefix to the URL for proper navigation (if not already present)
-        if self.url_prefix:
-            if parent_url and not parent_url.startswith(f"{self.url_prefix}/"):
-                parent_url = f"{self.url_prefix}/{parent_url}"
-            elif not parent_url:
-                # Parent is root, just use url_prefix
-                parent_url = f"{self.url_prefix}/"
+        parent_url = self._add_url_prefix(parent_url)
 
         # Get parent name
         parent_name = self._humanize_directory_name(parent)
@@ -213,9 +335,12 @@ class DirectoryIndexBuilder:
 
     def _collect_directory_context(
         self,
-        directory: Path,
+        directory: str,
         files: List[ProcessedFile],
-        all_files: List[ProcessedFile]
+        all_files: List[ProcessedFile],
+        subdirectory_index: Optional[Dict[str, Dict[str, int]]] = None,
+        directory_groups: Optional[Dict[str, List[ProcessedFile]]] = None,
+        latest_dates: Optional[Dict[str, datetime]] = None
     ) -> dict:
         """
         Build template context for a directory index.
@@ -224,6 +349,9 @@ class DirectoryIndexBuilder:
             directory: Directory to build context for
             files: Files in this directory
             all_files: All processed files (for subdirectory detection)
+            subdirectory_index: Precomputed result of _index_subdirectories()
+            directory_groups: Precomputed result of _group_by_directory(all_files)
+            latest_dates: Precomputed result of _index_latest_dates()
 
         Returns:
             Dictionary with directory_name, directory_path, subdirectories, pages, parent_dir_url, parent_dir_name
@@ -235,17 +363,24 @@ class DirectoryIndexBuilder:
         # Get parent directory info
         parent_dir_url, parent_dir_name = self._get_parent_directory_info(directory)
 
+        if directory_groups is None:
+            directory_groups = self._group_by_directory(all_files)
+        if subdirectory_index is None:
+            subdirectory_index = self._index_subdirectories(directory_groups)
+
         # Detect subdirectories
-        subdirectories = self._detect_subdirectories(directory, all_files)
+        subdirectories = self._detect_subdirectories(directory, all_files, subdirectory_index)
 
         # Collect page metadata
         pages = self._collect_page_metadata(files)
 
         # Calculate directory statistics
-        directory_stats = self._calculate_directory_stats(directory, files, all_files)
+        directory_stats = self._calculate_directory_stats(
+            directory, files, all_files, subdirectory_index, directory_groups, latest_dates
+        )
 
         # Add developer metadata to stats (for {% directory_metadata "for_dev" %})
-        directory_stats['directory_path'] = str(directory) if directory != Path('.') else ''
+        directory_stats['directory_path'] = directory
         directory_stats['url_pattern'] = f"/{directory_path}" if directory_path else "/"
         directory_stats['view_name'] = self._generate_view_name(directory)
         directory_stats['namespace'] = self.content_app
@@ -263,9 +398,12 @@ class DirectoryIndexBuilder:
 
     def _calculate_directory_stats(
         self,
-        directory: Path,
+        directory: str,
         files: List[ProcessedFile],
-        all_files: List[ProcessedFile]
+        all_files: List[ProcessedFile],
+        subdirectory_index: Optional[Dict[str, Dict[str, int]]] = None,
+        directory_groups: Optional[Dict[str, List[ProcessedFile]]] = None,
+        latest_dates: Optional[Dict[str, datetime]] = None
     ) -> dict:
         """
         Calculate aggregate statistics for a directory.
@@ -274,6 +412,9 @@ class DirectoryIndexBuilder:
             directory: Directory to calculate stats for
             files: Files directly in this directory
             all_files: All processed files (for recursive counting)
+            subdirectory_index: Precomputed result of _index_subdirectories()
+            directory_groups: Precomputed result of _group_by_directory(all_files)
+            latest_dates: Precomputed result of _index_latest_dates()
 
         Returns:
             Dictionary with total_pages, direct_pages, subdirectory_count, last_updated
@@ -281,68 +422,33 @@ class DirectoryIndexBuilder:
         # Direct pages = files in this specific directory
         direct_pages = len(files)
 
-        # Recursive count = all pages in this directory and subdirectories
-        total_pages = 0
-        last_updated = None
-
-        for pf in all_files:
-            # Normalize the file's directory path
-            relative_url = pf.relative_url.strip('/')
-
-            if '/' in relative_url:
-                # File is in a subdirectory - extract directory path
-                file_dir_str = '/'.join(relative_url.split('/')[:-1])
-                file_dir = Path(file_dir_str)
-            else:
-                # File is at root
-                file_dir = Path('.')
-
-            # Normalize directory path for comparison
-            # Handle both Path('.') and actual directory paths
-            compare_dir = directory if directory != Path('.') else Path('.')
-
-            # Check if this file is in the current directory tree
-            is_in_tree = False
-            if file_dir == compare_dir:
-                # Exact match - file is directly in this directory
-                is_in_tree = True
-            elif compare_dir != Path('.'):
-                # Try to see if file_dir is relative to compare_dir
-                try:
-                    file_dir.relative_to(compare_dir)
-                    is_in_tree = True
-                except ValueError:
-                    # file_dir is not relative to compare_dir
-                    is_in_tree = False
-            else:
-                # compare_dir is root ('.'), all files are in tree
-                is_in_tree = True
-
-            if is_in_tree:
-                total_pages += 1
+        if subdirectory_index is None or latest_dates is None:
+            if directory_groups is None:
+                directory_groups = self._group_by_directory(all_files)
+            if subdirectory_index is None:
+                subdirectory_index = self._index_subdirectories(directory_groups)
+            if latest_dates is None:
+                latest_dates = self._index_latest_dates(directory_groups)
 
-                # Track most recent modified/published date
-                # Fall back to published if modified not available
-                page_date = getattr(pf.context, 'modified', None) or getattr(pf.context, 'published', None)
-                if page_date:
-                    if last_updated is None or page_date > last_updated:
-                        last_updated = page_date
+        # Immediate children come straight from the subdirectory index, and their
+        # counts already include every page nested below them
+        children = subdirectory_index.get(directory, {})
 
-        # Subdirectories already calculated by _detect_subdirectories()
-        subdirectories = self._detect_subdirectories(directory, all_files)
-        subdirectory_count = len(subdirectories)
+        # Recursive count = all pages in this directory and subdirectories
+        total_pages = direct_pages + sum(children.values())
 
         return {
             'total_pages': total_pages,
             'direct_pages': direct_pages,
-            'subdirectory_count': subdirectory_count,
-            'last_updated': last_updated  # datetime or None
+            'subdirectory_count': len(children),
+            'last_updated': latest_dates.get(directory)  # datetime or None
         }
 
     def _detect_subdirectories(
         self,
-        parent_dir: Path,
-        all_files: List[ProcessedFile]
+        parent_dir: str,
+        all_files: List[ProcessedFile],
+        subdirectory_index: Optional[Dict[str, Dict[str, int]]] = None
     ) -> List[dict]:
         """
         Find immediate child directories of parent_dir.
@@ -350,54 +456,29 @@ class DirectoryIndexBuilder:
         Args:
             parent_dir: Parent directory
             all_files: All processed files
+            subdirectory_index: Precomputed result of _index_subdirectories()
 
         Returns:
             List of subdirectory dicts with title, url, page_count
         """
-        subdirs = defaultdict(int)
-
-        for pf in all_files:
-            # Use relative_url to determine file directory
-            relative_url = pf.relative_url.strip('/')
-
-            if '/' in relative_url:
-                # File is in a subdirectory
-                file_dir = Path('/'.join(relative_url.split('/')[:-1]))
-            else:
-                # File is at root
-                file_dir = Path('.')
-
-            # Check if this file is in a subdirectory of parent_dir
-            try:
-                # Get relative path from parent_dir to file_dir
-                relative = file_dir.relative_to(parent_dir)
-
-                # Get immediate child directory (first part of relative path)
-                if relative.parts:
-                    immediate_child = relative.parts[0]
-                    subdirs[immediate_child] += 1
-
-            except ValueError:
-                # file_dir is not relative to parent_dir, skip
-                continue
+        if subdirectory_index is None:
+            subdirectory_index = self._index_subdirectories(self._group_by_directory(all_files))
+        subdirs = subdirectory_index.get(parent_dir, {})
 
         # Build subdirectory list
         subdir_list = []
-        for subdir_name, page_count in sorted(subdirs.items()):
-            subdir_path = parent_dir / subdir_name
+        # Sort the names alone; sorting items would build and compare tuples
+        for subdir_name in sorted(subdirs):
+            subdir_path = f'{parent_dir}/{subdir_name}' if parent_dir else subdir_name
             subdir_url = self._build_directory_url(subdir_path)
 
             # Add url_prefix to subdirectory URL for proper absolute navigation (if not already present)
-            if self.url_prefix:
-                if subdir_url and not subdir_url.startswith(f"{self.url_prefix}/"):
-                    subdir_url = f"{self.url_prefix}/{subdir_url}"
-                elif not subdir_url:
-                    subdir_url = f"{self.url_prefix}/"
+            subdir_url = self._add_url_prefix(subdir_url)
 
             subdir_list.append({
-                'title': self._humanize_directory_name(Path(subdir_name)),
+                'title': self._humanize_directory_name(subdir_name),
                 'url': subdir_url,
-                'page_count': page_count
+                'page_count': subdirs[subdir_name]
             })
 
         return subdir_list
@@ -412,31 +493,32 @@ class DirectoryIndexBuilder:
         Returns:
             List of page dicts with title, url, published, modified, tags, description
         """
-        pages = []
+        # (sort key, page) pairs, so each title is case-folded exactly once
+        keyed_pages = []
 
         for pf in files:
             # Build page URL
             page_url = self._build_page_url(pf.relative_url)
 
             # Add url_prefix for absolute navigation in directory index (if not already present)
-            if self.url_prefix:
-                if page_url and not page_url.startswith(f"{self.url_prefix}/"):
-                    page_url = f"{self.url_prefix}/{page_url}"
-                elif not page_url:
-                    page_url = f"{self.url_prefix}/"
+            page_url = self._add_url_prefix(page_url)
 
-            # Get title (fallback to filename)
-            # Handle both Path objects and strings for original_path
-            original_path = pf.original_path if isinstance(pf.original_path, Path) else Path(pf.original_path)
-            title = getattr(pf.context, 'title', None) or original_path.stem.replace('_', ' ').replace('-', ' ').title()
+            context = pf.context
+
+            # Get title (fallback to filename, only derived when needed)
+            title = getattr(context, 'title', None)
+            if not title:
+                # os.path handles both Path objects and strings for original_path
+                stem = os.path.splitext(os.path.basename(pf.original_path))[0]
+                title = stem.replace('_', ' ').replace('-', ' ').title()
 
             # Collect metadata
             # Use getattr with default to handle mock objects gracefully
-            published = getattr(pf.context, 'published', None)
-            modified = getattr(pf.context, 'modified', None)
-            tags = getattr(pf.context, 'tags', None) or []
-            description = getattr(pf.context, 'description', None)
-            author = getattr(pf.context, 'author', None)
+            published = getattr(context, 'published', None)
+            modified = getattr(context, 'modified', None)
+            tags = getattr(context, 'tags', None) or []
+            description = getattr(context, 'description', None)
+            author = getattr(context, 'author', None)
 
             page_data = {
                 'title': title,
@@ -448,12 +530,12 @@ class DirectoryIndexBuilder:
                 'author': author
             }
 
-            pages.append(page_data)
+            keyed_pages.append((title.casefold(), page_data))
 
         # Sort alphabetically by title
-        pages.sort(key=lambda p: p['title'].lower())
+        keyed_pages.sort(key=itemgetter(0))
 
-        return pages
+        return [page_data for _, page_data in keyed_pages]
 
     def _build_page_url(self, relative_url: str) -> str:
         """
@@ -472,8 +554,8 @@ class DirectoryIndexBuilder:
         clean_url = get_clean_url(relative_url)
 
         # Remove url_prefix if it's at the start of the URL
-        if self.url_prefix and clean_url.startswith(self.url_prefix + '/'):
-            clean_url = clean_url[len(self.url_prefix) + 1:]
+        if self._prefix_slash and clean_url.startswith(self._prefix_slash):
+            clean_url = clean_url[len(self._prefix_slash):]
         elif self.url_prefix and clean_url == self.url_prefix:
             clean_url = ''
 
@@ -483,7 +565,7 @@ class DirectoryIndexBuilder:
         else:
             return ''
 
-    def _humanize_directory_name(self, directory: Path) -> str:
+    def _humanize_directory_name(self, directory: str) -> str:
         """
         Convert directory path to human-readable title.
 
@@ -493,13 +575,13 @@ class DirectoryIndexBuilder:
         Returns:
             Human-readable string
         """
-        if directory == Path('.'):
+        if not directory:
             # Use url_prefix if available, otherwise fall back to content_app
             name = self.url_prefix if self.url_prefix else self.content_app
             return name.replace('_', ' ').replace('-', ' ').title()
 
         # Get last part of path (directory name)
-        name = directory.name
+        name = directory.rpartition('/')[2]
 
         # Replace separators with spaces and title case
         name = name.replace('_', ' ').replace('-', ' ')
@@ -508,16 +590,14 @@ class DirectoryIndexBuilder:
         words = name.split()
         title_words = []
         for word in words:
-            if word.upper() in ['API', 'FAQ', 'TOC', 'URL', 'HTML', 'CSS', 'JS']:
-                title_words.append(word.upper())
-            else:
-                title_words.append(word.capitalize())
+            upper = word.upper()
+            title_words.append(upper if upper in _ACRONYMS else word.capitalize())
 
         return ' '.join(title_words)
 
     def _generate_view_function(
         self,
-        directory_path: Path,
+        directory_path: str,
         context_data: dict
     ) -> str:
         """
@@ -553,7 +633,7 @@ def {view_name}(request):
 
         return view_code
 
-    def _generate_url_pattern(self, directory_path: Path) -> str:
+    def _generate_url_pattern(self, directory_path: str) -> str:
         """
         Generate Django URL pattern string for a directory index.
 
@@ -575,7 +655,7 @@ def {view_name}(request):
 
         return f"path('{url_path}', views.{view_name}, name='{url_name}')"
 
-    def _generate_view_name(self, directory_path: Path) -> str:
+    def _generate_view_name(self, directory_path: str) -> str:
         """
         Generate a valid Python function name from directory path.
 
@@ -585,14 +665,14 @@ def {view_name}(request):
         Returns:
             Valid Python identifier
         """
-        if directory_path == Path('.'):
+        if not directory_path:
             return f'directory_index_root_{self.content_app}'
 
         # Convert path to valid identifier
         parts = []
-        for part in directory_path.parts:
+        for part in directory_path.split('/'):
             # Replace invalid characters
-            clean = part.replace('-', '_').replace(' ', '_').replace('/', '_')
+            clean = part.replace('-', '_').replace(' ', '_')
             # Remove leading/trailing underscores
             clean = clean.strip('_')
             if clean:  # Only add non-empty parts
@@ -605,6 +685,11 @@ def {view_name}(request):
         """
         Convert dictionary to Python literal string representation.
 
+        Each key goes on its own line and list values are expanded one item
+        per line; everything else is rendered with a single repr() call,
+        which keeps the generated views readable without recursing in Python.
+        All lines are collected in one list and joined once.
+
         Args:
             d: Dictionary to convert
             indent: Current indentation level
@@ -616,59 +701,16 @@ def {view_name}(request):
             return '{}'
 
         indent_str = '    ' * indent
+        item_indent_str = indent_str + '    '
         lines = ['{']
 
         for key, value in d.items():
-            # Format key
-            key_repr = repr(key)
-
-            # Format value
-            if isinstance(value, dict):
-                value_repr = self._dict_to_python_literal(value, indent + 1)
-            elif isinstance(value, list):
-                value_repr = self._list_to_python_literal(value, indent + 1)
-            elif isinstance(value, str):
-                value_repr = repr(value)
-            elif value is None:
-                value_repr = 'None'
+            if isinstance(value, list) and value:
+                lines.append(f'{indent_str}{key!r}: [')
+                lines.extend(f'{item_indent_str}{item!r},' for item in value)
+                lines.append(f'{indent_str}],')
             else:
-                value_repr = repr(value)
-
-            lines.append(f'{indent_str}{key_repr}: {value_repr},')
+                lines.append(f'{indent_str}{key!r}: {value!r},')
 
         lines.append('    ' * (indent - 1) + '}')
         return '\n'.join(lines)
-
-    def _list_to_python_literal(self, lst: list, indent: int = 1) -> str:
-        """
-        Convert list to Python literal string representation.
-
-        Args:
-            lst: List to convert
-            indent: Current indentation level
-
-        Returns:
-            String representation of list
-        """
-        if not lst:
-            return '[]'
-
-        indent_str = '    ' * indent
-        lines = ['[']
-
-        for item in lst:
-            if isinstance(item, dict):
-                item_repr = self._dict_to_python_literal(item, indent + 1)
-            elif isinstance(item, list):
-                item_repr = self._list_to_python_literal(item, indent + 1)
-            elif isinstance(item, str):
-                item_repr = repr(item)
-            elif item is None:
-                item_repr = 'None'
-            else:
-                item_repr = repr(item)
-
-            lines.append(f'{indent_str}{item_repr},')
-
-        lines.append('    ' * (indent - 1) + ']')
-        return '\n'.join(lines)
@@ -64,8 +64,12 @@ class MarkdownFileProcessor:
     def _read_markdown_file(self, file_path: Path) -> str:
         """Reads and returns the content of a markdown file"""
         try:
-            with open(file_path, 'r', encoding='utf-8') as f:
-                return f.read()
+            # Decoding the whole file at once skips the text-mode wrapper;
+            # normalize newlines the way text mode would have
+            md_text = file_path.read_bytes().decode('utf-8')
+            if '\r' in md_text:
+                md_text = md_text.replace('\r\n', '\n').replace('\r', '\n')
+            return md_text
         except Exception as e:
             raise MarkdownProcessingError(
                 f"Error reading file {file_path}: {str(e)}")
@@ -2,6 +2,7 @@
 
 import os
 import logging
+import re
 from pathlib import Path
 from typing import List, Dict, Optional
 
@@ -14,6 +15,10 @@ from django_spellbook.management.commands.processing.generator_utils import (
 
 logger = logging.getLogger(__name__)
 
+# Matches the app includes written into the main urls.py, capturing the
+# URL prefix and the module name
+_INCLUDE_RE = re.compile(r"path\('([^']+)',\s*include\('django_spellbook\.([^']+)'\)\)")
+
 class FileWriter:
     """
     Handles file I/O operations for the URL and view generators.
@@ -85,6 +90,7 @@ urlpatterns = [
         
         # Dictionary of existing includes
         includes = {}
+        content = None
         
         if os.path.exists(main_urls_path):
             # Read existing file content
@@ -93,9 +99,7 @@ urlpatterns = [
                     content = f.read()
                 
                 # Extract existing includes using regex
-                import re
-                pattern = r"path\('([^']+)',\s*include\('django_spellbook\.([^']+)'\)\)"
-                matches = re.findall(pattern, content)
+                matches = _INCLUDE_RE.findall(content)
                 
                 for prefix, module in matches:
                     # Strip trailing slashes from the prefix
@@ -115,10 +119,26 @@ urlpatterns = [
             for module, prefix in includes.items()
         ])
         
-        # Write the updated main urls.py
+        # Write the updated main urls.py, unless it already has this content
         main_urls_content = self.MAIN_URLS_TEMPLATE.format(includes=includes_str)
+        if content == main_urls_content:
+            logger.debug("Main urls.py is up to date: %s", main_urls_path)
+            return
         write_file(main_urls_path, main_urls_content)
 
+    def _write_if_changed(self, file_path: str, content: str) -> None:
+        """Write content to a file unless it already holds exactly that content."""
+        try:
+            # Read in the same text mode write_file() uses, so the comparison matches
+            with open(file_path, 'r') as f:
+                if f.read() == content:
+                    logger.debug("File is up to date: %s", file_path)
+                    return
+        except (OSError, ValueError):
+            # Missing or unreadable files are simply rewritten
+            pass
+        write_file(file_path, content)
+
     def write_urls_file(self, url_patterns: List[str]) -> None:
         """Write URL patterns to app-specific urls.py file."""
         try:
@@ -138,7 +158,7 @@ urlpatterns = [
     {urls_str}
 ]"""
             file_path = os.path.join(self.spellbook_dir, f"{self.urls_module}.py")
-            write_file(file_path, content)
+            self._write_if_changed(file_path, content)
         except Exception as e:
             raise CommandError(f"Failed to write URLs file: {str(e)}")
 
@@ -154,6 +174,6 @@ TOC = {toc}
 
 {views_str}"""
             file_path = os.path.join(self.spellbook_dir, f"{self.views_module}.py")
-            write_file(file_path, content)
+            self._write_if_changed(file_path, content)
         except Exception as e:
             raise CommandError(f"Failed to write views file: {str(e)}")
\ No newline at end of file
@@ -3,25 +3,39 @@
 import os
 import logging
 import re
+from functools import lru_cache
 from pathlib import Path
 from typing import Dict, Any, List, Optional
 
 logger = logging.getLogger(__name__)
 
+# Runs of separators that become a single underscore in view names
+_VIEW_NAME_SEPARATORS_RE = re.compile(r"[/\s\-.]+")
+# Anything else that can't appear in a Python identifier
+_VIEW_NAME_INVALID_RE = re.compile(r"[^\w]+")
+
 def remove_leading_dash(text: str) -> str:
     """Remove leading dash from text."""
     return text.lstrip('-')
 
+@lru_cache(maxsize=8192)
 def get_clean_url(url_pattern: str) -> str:
-    """Create a clean URL from a pattern by removing leading dashes."""
-    parts = url_pattern.split('/')
-    clean_parts = [remove_leading_dash(part) for part in parts]
-    return '/'.join(clean_parts)
+    """
+    Create a clean URL from a pattern by removing leading dashes.
+
+    Each page's URL is cleaned by several generators and by navigation
+    lookups, so results are memoized for the run.
+    """
+    # lstrip inline rather than via remove_leading_dash() for each part
+    return '/'.join([part.lstrip('-') for part in url_pattern.split('/')])
 
+@lru_cache(maxsize=8192)
 def generate_view_name(url_pattern: str) -> str:
     """
     Generates a valid Python identifier for a view name from a URL pattern.
 
+    The URL and view generators both name every page, so results are memoized.
+
     Args:
         url_pattern: The URL pattern string.
 
@@ -32,10 +46,10 @@ def generate_view_name(url_pattern: str) -> str:
         print(f"Warning: Empty URL pattern detected. Returning 'view_'.")
         return "view_"
     # Replace slashes, hyphens, spaces, and periods with underscores
-    view_name = re.sub(r"[/\s\-.]+", "_", url_pattern)
+    view_name = _VIEW_NAME_SEPARATORS_RE.sub("_", url_pattern)
 
     # Remove any remaining characters that are not alphanumeric or underscore
-    view_name = re.sub(r"[^\w]+", "", view_name)
+    view_name = _VIEW_NAME_INVALID_RE.sub("", view_name)
 
     # Remove leading/trailing underscores
     view_name = view_name.strip("_")
@@ -59,31 +73,36 @@ def get_template_path(content_app: str, relative_url: str) -> str:
     """Generate template path from relative URL."""
     return os.path.join(content_app, 'spellbook_md', relative_url + '.html')
 
+@lru_cache(maxsize=1)
 def get_spellbook_dir() -> str:
-    """Get the django_spellbook base directory."""
+    """Get the django_spellbook base directory (fixed for the process, so cached)."""
     return os.path.abspath(os.path.join(os.path.dirname(__file__), '../../..'))
 
+def _open_for_writing(file_path: str, mode: str):
+    """Open a file for writing, creating its directory only if it is missing."""
+    try:
+        return open(file_path, mode)
+    except FileNotFoundError:
+        os.makedirs(os.path.dirname(file_path), exist_ok=True)
+        return open(file_path, mode)
+
 def create_file_if_not_exists(file_path: str, content: str) -> None:
     """Create a file with initial content if it doesn't exist."""
-    if not os.path.exists(file_path):
-        try:
-            # Ensure the directory exists
-            os.makedirs(os.path.dirname(file_path), exist_ok=True)
-            
-            with open(file_path, 'w') as f:
-                f.write(content)
-            logger.debug(f"Created new file: {file_path}")
-        except IOError as e:
-            from django.core.management.base import CommandError
-            raise CommandError(f"Failed to create {file_path}: {str(e)}")
+    try:
+        # Exclusive mode fails if the file exists, without a separate exists() check
+        with _open_for_writing(file_path, 'x') as f:
+            f.write(content)
+    except FileExistsError:
+        return
+    except IOError as e:
+        from django.core.management.base import CommandError
+        raise CommandError(f"Failed to create {file_path}: {str(e)}")
+    logger.debug(f"Created new file: {file_path}")
             
 def write_file(file_path: str, content: str) -> None:
     """Write content to a file, ensuring directory exists."""
     try:
-        # Ensure the directory exists
-        os.makedirs(os.path.dirname(file_path), exist_ok=True)
-        
-        with open(file_path, 'w') as f:
+        with _open_for_writing(file_path, 'w') as f:
             f.write(content)
     except IOError as e:
         from django.core.management.base import CommandError
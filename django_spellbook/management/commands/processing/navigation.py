@@ -1,9 +1,8 @@
 # django_spellbook/management/commands/processing/navigation.py
 
 import logging
+import os
 from typing import List, Dict, Tuple
-from pathlib import Path
-from collections import defaultdict
 
 from django_spellbook.management.commands.processing.file_processor import ProcessedFile
 from django_spellbook.management.commands.processing.generator_utils import get_clean_url
@@ -40,10 +39,13 @@ class NavigationBuilder:
         # Group files by parent directory
         groups = NavigationBuilder._group_files(processed_files)
 
+        # Index files by clean URL once for path-based frontmatter lookups
+        url_index = NavigationBuilder._index_by_clean_url(processed_files)
+
         # Build navigation for each group independently
         for directory, files in groups.items():
-            logger.debug(f"Building navigation for {len(files)} files in {content_app}:{directory}")
-            NavigationBuilder._build_group_navigation(files, content_app, processed_files)
+            logger.debug("Building navigation for %s files in %s:%s", len(files), content_app, directory)
+            NavigationBuilder._build_group_navigation(files, content_app, url_index)
 
     @staticmethod
     def _group_files(processed_files: List[ProcessedFile]) -> Dict[str, List[ProcessedFile]]:
@@ -56,26 +58,42 @@ class NavigationBuilder:
         Returns:
             Dictionary mapping directory to list of files
         """
-        groups = defaultdict(list)
+        groups = {}
 
         for pf in processed_files:
-            # Get parent directory from original path
-            parent_dir = Path(pf.original_path).parent
-
-            # Group by directory
-            groups[str(parent_dir)].append(pf)
+            # Group by parent directory; os.path.dirname is a plain string op
+            groups.setdefault(os.path.dirname(pf.original_path), []).append(pf)
 
         return groups
 
     @staticmethod
-    def _build_group_navigation(files: List[ProcessedFile], app: str, all_files: List[ProcessedFile]) -> None:
+    def _index_by_clean_url(processed_files: List[ProcessedFile]) -> Dict[str, ProcessedFile]:
+        """
+        Map each file's clean URL to the file, for path-based navigation lookup.
+
+        Args:
+            processed_files: List of processed markdown files
+
+        Returns:
+            Dictionary mapping clean URL to the first file with that URL
+        """
+        url_index = {}
+
+        for pf in processed_files:
+            # Keep the first file for a URL, matching a front-to-back search
+            url_index.setdefault(get_clean_url(pf.relative_url), pf)
+
+        return url_index
+
+    @staticmethod
+    def _build_group_navigation(files: List[ProcessedFile], app: str, url_index: Dict[str, ProcessedFile]) -> None:
         """
         Build navigation for a group of files in the same app/directory.
 
         Args:
             files: List of files in the same app and directory
             app: Content app name
-            all_files: All processed files (for path-based navigation lookup)
+            url_index: Result of _index_by_clean_url() for all processed files
         """
         # Sort files alphabetically
         sorted_files = sorted(files, key=NavigationBuilder._get_sort_key)
@@ -90,13 +108,13 @@ class NavigationBuilder:
             if fm_prev is not None:
                 # Normalize frontmatter value (supports both path and namespaced formats)
                 current_file.context.prev_page = NavigationBuilder._normalize_navigation_value(
-                    fm_prev, all_files, app
+                    fm_prev, url_index, app
                 )
-                logger.debug(f"Using frontmatter prev for {current_file.relative_url}: {current_file.context.prev_page}")
+                logger.debug("Using frontmatter prev for %s: %s", current_file.relative_url, current_file.context.prev_page)
             elif i > 0:
                 prev_file = sorted_files[i - 1]
                 current_file.context.prev_page = NavigationBuilder._build_namespaced_url(prev_file, app)
-                logger.debug(f"Auto prev for {current_file.relative_url}: {current_file.context.prev_page}")
+                logger.debug("Auto prev for %s: %s", current_file.relative_url, current_file.context.prev_page)
             else:
                 # First file in group, no previous
                 current_file.context.prev_page = None
@@ -105,13 +123,13 @@ class NavigationBuilder:
             if fm_next is not None:
                 # Normalize frontmatter value (supports both path and namespaced formats)
                 current_file.context.next_page = NavigationBuilder._normalize_navigation_value(
-                    fm_next, all_files, app
+                    fm_next, url_index, app
                 )
-                logger.debug(f"Using frontmatter next for {current_file.relative_url}: {current_file.context.next_page}")
+                logger.debug("Using frontmatter next for %s: %s", current_file.relative_url, current_file.context.next_page)
             elif i < len(sorted_files) - 1:
                 next_file = sorted_files[i + 1]
                 current_file.context.next_page = NavigationBuilder._build_namespaced_url(next_file, app)
-                logger.debug(f"Auto next for {current_file.relative_url}: {current_file.context.next_page}")
+                logger.debug("Auto next for %s: %s", current_file.relative_url, current_file.context.next_page)
             else:
                 # Last file in group, no next
                 current_file.context.next_page = None
@@ -127,8 +145,8 @@ class NavigationBuilder:
         Returns:
             String key for sorting (lowercase filename)
         """
-        filename = Path(processed_file.original_path).name.lower()
-        return filename
+        # os.path works on both str and Path original_path without building a Path
+        return os.path.basename(processed_file.original_path).lower()
 
     @staticmethod
     def _get_frontmatter_override(processed_file: ProcessedFile, field: str) -> str:
@@ -148,7 +166,7 @@ class NavigationBuilder:
 
         # Ensure result is a string or None (not a Mock or other type)
         if result is not None and not isinstance(result, str):
-            logger.debug(f"Frontmatter override for {field} is not a string: {type(result).__name__}, treating as None")
+            logger.debug("Frontmatter override for %s is not a string: %s, treating as None", field, type(result).__name__)
             return None
 
         return result
@@ -177,29 +195,16 @@ class NavigationBuilder:
         if not isinstance(value, str):
             return False
 
-        if ':' not in value:
-            return False  # No colon = path format
-
-        # Split on first colon
-        parts = value.split(':', 1)
-        if len(parts) != 2:
+        # No colon = path format; leading colon (":something") is invalid - treat as path
+        colon = value.find(':')
+        if colon <= 0:
             return False
 
-        app_part = parts[0]
-
         # If app part contains '/', it's probably a path (invalid but treat as path)
-        if '/' in app_part:
-            return False
-
-        # If app part is empty, it's invalid (":something") - treat as path
-        if not app_part:
-            return False
-
-        # Looks like valid namespaced format: "app:page"
-        return True
+        return value.find('/', 0, colon) == -1
 
     @staticmethod
-    def _normalize_navigation_value(value: str, processed_files: List[ProcessedFile], app: str) -> str:
+    def _normalize_navigation_value(value: str, url_index: Dict[str, ProcessedFile], app: str) -> str:
         """
         Convert frontmatter navigation value to namespaced URL format.
 
@@ -209,7 +214,7 @@ class NavigationBuilder:
 
         Args:
             value: Raw frontmatter value (prev or next)
-            processed_files: All processed files (for lookup)
+            url_index: Result of _index_by_clean_url() for all processed files
             app: Current content app
 
         Returns:
@@ -222,26 +227,25 @@ class NavigationBuilder:
 
         # Already in namespaced format - use as-is
         if NavigationBuilder._is_namespaced_format(value):
-            logger.debug(f"Navigation value '{value}' is already namespaced")
+            logger.debug("Navigation value '%s' is already namespaced", value)
             return value
 
         # Path-based - find matching file and convert
         clean_path = get_clean_url(value)
-        logger.debug(f"Converting path-based navigation '{value}' (clean: '{clean_path}')")
+        logger.debug("Converting path-based navigation '%s' (clean: '%s')", value, clean_path)
 
-        # Search for matching file by relative_url
-        for pf in processed_files:
-            pf_clean_url = get_clean_url(pf.relative_url)
-            if pf_clean_url == clean_path:
-                namespaced = NavigationBuilder._build_namespaced_url(pf, app)
-                logger.debug(f"Found matching file: '{pf.relative_url}' -> '{namespaced}'")
-                return namespaced
+        # Look up matching file by clean relative_url
+        pf = url_index.get(clean_path)
+        if pf is not None:
+            namespaced = NavigationBuilder._build_namespaced_url(pf, app)
+            logger.debug("Found matching file: '%s' -> '%s'", pf.relative_url, namespaced)
+            return namespaced
 
         # Fallback: construct namespaced URL from path
         # (in case file isn't in current batch or will be added later)
         url_name = clean_path.replace('/', '_')
         fallback = f"{app}:{url_name}"
-        logger.debug(f"No matching file found, using fallback: '{fallback}'")
+        logger.debug("No matching file found, using fallback: '%s'", fallback)
         return fallback
 
     @staticmethod
@@ -4,6 +4,8 @@ from django.conf import settings
 import markdown
 import logging
 import re
+import string
+import threading
 from re import Match
 from typing import List, Tuple, Dict, Any, Optional, Type
 #StringIO
@@ -44,6 +46,20 @@ CODE_FENCE_PATTERN = re.compile(r'^```')
 # Handles: key="value", key='value', key=value_without_quotes
 ARGUMENT_PARSER_PATTERN = re.compile(r'(\w+)=(?:"([^"]*?)"|\'([^\']*?)\'|([^\s"\'=<>`]+))')
 
+# Characters python-markdown leaves untouched inside a single-line paragraph
+# when only the default extensions are enabled
+PLAIN_TEXT_CHARACTERS = frozenset(string.ascii_letters + string.digits + " .,;:!?'\"()/%$@=+")
+
+
+def is_plain_text(text: str) -> bool:
+    """
+    Check whether text renders to just itself wrapped in a paragraph.
+
+    The text must start with a letter (so it can't open a list or code block)
+    and contain only characters that carry no markdown or HTML meaning.
+    """
+    return bool(text) and text[0] in string.ascii_letters and PLAIN_TEXT_CHARACTERS.issuperset(text)
+
 
 class SpellbookMarkdownEngine:
     """
@@ -93,6 +109,8 @@ class SpellbookMarkdownEngine:
         
         reporter.write(f"SpellbookMarkdownEngine: Found {blocks} blocks.", level='debug')
 
+        # Plain-text shortcuts are only safe with the known default extensions
+        self.uses_default_extensions: bool = markdown_extensions is None
         if markdown_extensions is None:
             self.markdown_extensions: List[Any] = [
                 ListFixerExtension(),  # Preprocessor: adds blank lines before lists
@@ -107,7 +125,24 @@ class SpellbookMarkdownEngine:
         else:
             self.markdown_extensions = markdown_extensions
 
-        logger.debug(f"SpellbookMarkdownEngine initialized with extensions: {self.markdown_extensions}")
+        # One python-markdown parser per thread, built lazily and reset between
+        # conversions, so extensions are registered once per engine.
+        self._local = threading.local()
+
+        logger.debug("SpellbookMarkdownEngine initialized with extensions: %s", self.markdown_extensions)
+
+    def _get_markdown(self) -> markdown.Markdown:
+        """
+        Returns this thread's python-markdown parser, creating it on first use.
+
+        The parser is reset before being returned so state left behind by a
+        previous conversion (footnotes, TOC, references) does not leak.
+        """
+        md = getattr(self._local, 'md', None)
+        if md is None:
+            md = markdown.Markdown(extensions=self.markdown_extensions)
+            self._local.md = md
+        return md.reset()
 
     def _split_markdown_by_code_fences(self, markdown_text: str) -> List[Tuple[str, bool]]:
         """
@@ -138,7 +173,7 @@ class SpellbookMarkdownEngine:
         if current_segment_lines: # Append any remaining segment
             segments.append(("".join(current_segment_lines), in_code_block))
         
-        logger.debug(f"Split markdown into {len(segments)} segments (code/non-code).")
+        logger.debug("Split markdown into %s segments (code/non-code).", len(segments))
         return segments
 
     def _parse_spellblock_arguments(self, raw_args_str: str) -> Dict[str, str]:
@@ -148,7 +183,7 @@ class SpellbookMarkdownEngine:
         kwargs = parse_spellblock_style_attributes(raw_args_str, self.reporter)
         
 
-        logger.debug(f"Parsed arguments from '{raw_args_str}' (via util): {kwargs}")
+        logger.debug("Parsed arguments from '%s' (via util): %s", raw_args_str, kwargs)
         return kwargs
 
     def _process_single_spellblock(
@@ -176,7 +211,7 @@ class SpellbookMarkdownEngine:
                  indicating an error if processing fails.
         """
         self.reporter.write(f"Processing SpellBlock: {block_name}", level='debug')
-        logger.debug(f"Attempting to process SpellBlock: {block_name}, Args: '{raw_args_str}', Self-closing: {is_self_closing}")
+        logger.debug("Attempting to process SpellBlock: %s, Args: '%s', Self-closing: %s", block_name, raw_args_str, is_self_closing)
 
         BlockClass = SpellBlockRegistry.get_block(block_name)
         if not BlockClass:
@@ -218,7 +253,7 @@ class SpellbookMarkdownEngine:
             print(processed_html) # Show what will be used
             print("------------------------------------\n")
 
-        logger.debug(f"Successfully rendered SpellBlock: {block_name}")
+        logger.debug("Successfully rendered SpellBlock: %s", block_name)
         return processed_html
 
     def _process_spellblocks_in_segment(self, markdown_segment: str) -> str:
@@ -308,6 +343,10 @@ class SpellbookMarkdownEngine:
             level='debug'
             )
         
+        if self.uses_default_extensions and is_plain_text(markdown_text):
+            self.reporter.success("SpellbookMarkdownEngine: Plain text rendered without markdown parsing.")
+            return f"<p>{markdown_text}</p>"
+
         segments = self._split_markdown_by_code_fences(markdown_text)
         
         processed_segments_content: List[str] = []
@@ -327,11 +366,7 @@ class SpellbookMarkdownEngine:
         logger.debug("All segments processed for SpellBlocks.")
 
         # Final conversion of the (now modified) markdown to HTML
-        final_html = markdown.markdown(
-            text_with_rendered_spellblocks,
-            extensions=self.markdown_extensions,
-            # output_format="html5" # Consider for modern HTML output
-        )
+        final_html = self._get_markdown().convert(text_with_rendered_spellblocks)
         self.reporter.success("SpellbookMarkdownEngine: Markdown to HTML conversion complete.")
         logger.info("Successfully converted processed markdown to HTML.")
         return final_html
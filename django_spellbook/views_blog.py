@@ -41,26 +41,9 @@ def directory_index_root_blog(request):
     'parent_dir_name': None,
     'subdirectories': [],
     'pages': [
-        {
-            'title': 'First Post',
-            'url': 'blog/first-post/',
-            'published': None,
-            'modified': None,
-            'tags': [],
-            'description': None,
-            'author': None,
-        },
+        {'title': 'First Post', 'url': 'blog/first-post/', 'published': None, 'modified': None, 'tags': [], 'description': None, 'author': None},
     ],
-    'directory_stats': {
-        'total_pages': 1,
-        'direct_pages': 1,
-        'subdirectory_count': 0,
-        'last_updated': None,
-        'directory_path': '',
-        'url_pattern': '/',
-        'view_name': 'directory_index_root_blog',
-        'namespace': 'blog',
-    },
+    'directory_stats': {'total_pages': 1, 'direct_pages': 1, 'subdirectory_count': 0, 'last_updated': None, 'directory_path': '', 'url_pattern': '/', 'view_name': 'directory_index_root_blog', 'namespace': 'blog'},
     'is_directory_index': True,
 }
     context['toc'] = TOC
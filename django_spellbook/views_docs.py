@@ -41,26 +41,9 @@ def directory_index_root_docs(request):
     'parent_dir_name': None,
     'subdirectories': [],
     'pages': [
-        {
-            'title': 'Documentation Intro',
-            'url': 'intro/',
-            'published': None,
-            'modified': None,
-            'tags': [],
-            'description': None,
-            'author': None,
-        },
+        {'title': 'Documentation Intro', 'url': 'intro/', 'published': None, 'modified': None, 'tags': [], 'description': None, 'author': None},
     ],
-    'directory_stats': {
-        'total_pages': 1,
-        'direct_pages': 1,
-        'subdirectory_count': 0,
-        'last_updated': None,
-        'directory_path': '',
-        'url_pattern': '/',
-        'view_name': 'directory_index_root_docs',
-        'namespace': 'docs',
-    },
+    'directory_stats': {'total_pages': 1, 'direct_pages': 1, 'subdirectory_count': 0, 'last_updated': None, 'directory_path': '', 'url_pattern': '/', 'view_name': 'directory_index_root_docs', 'namespace': 'docs'},
     'is_directory_index': True,
 }
     context['toc'] = TOC
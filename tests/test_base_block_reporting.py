@@ -136,7 +136,10 @@ class TestBasicSpellBlockReporting(unittest.TestCase):
         template_mock = Mock()
         template_mock.render.return_value = "<div>mocked content</div>"
         
-        with patch('django.template.loader.get_template', return_value=template_mock) as mock_get_template:
+        BasicSpellBlock._template_cache.clear()
+        self.addCleanup(BasicSpellBlock._template_cache.clear)
+
+        with patch('django_spellbook.blocks.base.get_template', return_value=template_mock) as mock_get_template:
             # Create a block with the reporter
             block = StandardBlock(content="test content", reporter=self.reporter)
             
@@ -144,7 +147,7 @@ class TestBasicSpellBlockReporting(unittest.TestCase):
             result = block.render()
             
             # Verify it called get_template
-            mock_get_template.assert_called_once_with("standard_template.html", using=None)
+            mock_get_template.assert_called_once_with("standard_template.html")
             
             # Verify the result
             self.assertEqual(result, "<div>mocked content</div>")
@@ -35,7 +35,7 @@ class TestExtendFromValidation(TestCase):
         except CommandError:
             self.fail("_validate_extend_from_setting raised CommandError unexpectedly with None values")
 
-    @patch('django.template.loader.get_template')
+    @patch('django_spellbook.management.commands.command_utils.get_template')
     def test_template_not_found(self, mock_get_template):
         """Error if template doesn't exist."""
         mock_get_template.side_effect = TemplateDoesNotExist('nonexistent/base.html')
@@ -47,7 +47,7 @@ class TestExtendFromValidation(TestCase):
             )
         self.assertIn('template not found', str(cm.exception))
 
-    @patch('django.template.loader.get_template')
+    @patch('django_spellbook.management.commands.command_utils.get_template')
     def test_missing_spellbook_block(self, mock_get_template):
         """Error if template missing {% block spellbook %}."""
         # Create a mock template without the spellbook block
@@ -69,7 +69,7 @@ class TestExtendFromValidation(TestCase):
         self.assertIn('missing required block', str(cm.exception))
         self.assertIn('spellbook', str(cm.exception))
 
-    @patch('django.template.loader.get_template')
+    @patch('django_spellbook.management.commands.command_utils.get_template')
     def test_template_with_spellbook_block_passes(self, mock_get_template):
         """Template with {% block spellbook %} passes validation."""
         mock_template = MagicMock()
@@ -91,6 +91,18 @@ class TestExtendFromValidation(TestCase):
         except CommandError:
             self.fail("Validation failed for template with spellbook block")
 
+    @patch('django_spellbook.management.commands.command_utils.get_template')
+    def test_shared_template_loaded_once(self, mock_get_template):
+        """A template shared by several apps is loaded and checked once."""
+        mock_get_template.return_value.template.source = '{% block spellbook %}{% endblock %}'
+
+        _validate_extend_from_setting(
+            ['myapp/base.html', None, 'myapp/base.html'],
+            ['app1', 'app2', 'app3']
+        )
+
+        mock_get_template.assert_called_once_with('myapp/base.html')
+
 
 class TestSpellbookBaseGenerator(TestCase):
     """Test SpellbookBaseGenerator class."""
@@ -220,6 +232,37 @@ class TestSpellbookBaseGenerator(TestCase):
         self.assertIn('myapp/base_v2.html', content2)
         self.assertNotIn('myapp/base_v1.html', content2)
 
+    def test_generate_leaves_no_temp_file(self):
+        """Generated file is swapped into place without leaving a temp file."""
+        SpellbookBaseGenerator('test_app', self.template_dir, 'myapp/base.html').process()
+
+        self.assertEqual(
+            sorted(p.name for p in self.template_dir.iterdir()),
+            ['spellbook_base.html']
+        )
+
+    def test_generate_removes_temp_file_on_failure(self):
+        """Temp file is cleaned up when swapping it into place fails."""
+        generator = SpellbookBaseGenerator('test_app', self.template_dir, 'myapp/base.html')
+
+        with patch('os.replace', side_effect=OSError("Test replace error")):
+            with self.assertRaises(OSError):
+                generator.process()
+
+        self.assertEqual(list(self.template_dir.iterdir()), [])
+
+    def test_skeleton_read_once(self):
+        """Skeleton file is read once and reused across generators."""
+        SpellbookBaseGenerator._skeleton.cache_clear()
+        self.addCleanup(SpellbookBaseGenerator._skeleton.cache_clear)
+
+        with patch.object(Path, 'read_text', autospec=True, return_value='__EXTEND_FROM__') as mock_read:
+            for extend_from in ('myapp/a.html', 'myapp/b.html'):
+                SpellbookBaseGenerator('test_app', self.template_dir, extend_from).process()
+
+        mock_read.assert_called_once_with(SpellbookBaseGenerator.SKELETON_PATH)
+        self.assertEqual((self.template_dir / 'spellbook_base.html').read_text(), 'myapp/b.html')
+
 
 class TestExtendFromPrecedence(TestCase):
     """Test EXTEND_FROM takes precedence over BASE_TEMPLATE."""
@@ -230,7 +273,7 @@ class TestExtendFromPrecedence(TestCase):
         SPELLBOOK_MD_BASE_TEMPLATE='custom_base.html',
         SPELLBOOK_BASE_EXTEND_FROM='myapp/base.html'
     )
-    @patch('django.template.loader.get_template')
+    @patch('django_spellbook.management.commands.command_utils.get_template')
     def test_extend_from_overrides_base_template(self, mock_get_template):
         """EXTEND_FROM used when both are set."""
         # Mock the template to have the spellbook block
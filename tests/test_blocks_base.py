@@ -2,7 +2,7 @@ import unittest
 from unittest.mock import patch, Mock
 from django.test import TestCase
 from django.template.loader import render_to_string
-from django_spellbook.blocks.base import BasicSpellBlock
+from django_spellbook.blocks.base import BasicSpellBlock, _render_plain_markdown
 from django_spellbook.markdown.extensions.list_aware_nl2br import ListAwareNl2BrExtension
 from django_spellbook.markdown.preprocessors.list_fixer import ListFixerExtension
 
@@ -13,6 +13,9 @@ from io import StringIO
 class TestBasicSpellBlock(TestCase):
     def setUp(self):
         """Set up test cases with a basic block instance."""
+        _render_plain_markdown.cache_clear()
+        BasicSpellBlock._template_cache.clear()
+        self.addCleanup(BasicSpellBlock._template_cache.clear)
         class TestBlock(BasicSpellBlock):
             name = 'test_block'
             template = 'test_template.html'
@@ -54,15 +57,17 @@ class TestBasicSpellBlock(TestCase):
         self.assertEqual(context['required_param'], 'test_required')
         self.assertEqual(context['optional_param'], 'test_optional')
 
-    @patch('markdown.markdown')
+    @patch('markdown.Markdown')
     def test_process_content(self, mock_markdown):
         """Test markdown content processing."""
-        mock_markdown.return_value = '<h1>Test Header</h1>\n<p>Test content</p>'
+        mock_convert = mock_markdown.return_value.reset.return_value.convert
+        mock_convert.return_value = '<h1>Test Header</h1>\n<p>Test content</p>'
         block = self.BlockClass(MarkdownReporter(StringIO()), self.test_content)
         processed_content = block.process_content()
         
         # Get the actual call arguments
-        args, kwargs = mock_markdown.call_args
+        _, kwargs = mock_markdown.call_args
+        args, _ = mock_convert.call_args
         
         # Verify the content matches
         self.assertEqual(args[0], self.test_content + '')
@@ -99,16 +104,18 @@ class TestBasicSpellBlock(TestCase):
 
         # Create a mock for process_content
         with patch.object(block, 'process_content', return_value='<p>Processed content</p>') as mock_process:
-            # Create a mock for render_to_string
-            with patch('django_spellbook.blocks.base.render_to_string', return_value=expected_output) as mock_render:
+            # Create a mock for template loading
+            with patch('django_spellbook.blocks.base.get_template') as mock_get_template:
+                mock_render = mock_get_template.return_value.render
+                mock_render.return_value = expected_output
                 rendered_content = block.render()
 
                 # Verify process_content was called
                 mock_process.assert_called_once()
 
-                # Verify render_to_string was called with correct parameters
+                # Verify the template was loaded and rendered with correct parameters
+                mock_get_template.assert_called_once_with('test_template.html')
                 mock_render.assert_called_once_with(
-                    'test_template.html',
                     {
                         'content': '<p>Processed content</p>',
                         'required_param': 'test_required',
@@ -118,6 +125,42 @@ class TestBasicSpellBlock(TestCase):
 
                 self.assertEqual(rendered_content, expected_output)
 
+    def test_template_resolved_once(self):
+        """Test that a block's template is only resolved through the loaders once."""
+        block = self.BlockClass(MarkdownReporter(StringIO()), self.test_content, **self.test_kwargs)
+
+        with patch('django_spellbook.blocks.base.get_template') as mock_get_template:
+            block.render()
+            self.BlockClass(MarkdownReporter(StringIO()), 'Other', **self.test_kwargs).render()
+
+            mock_get_template.assert_called_once_with('test_template.html')
+            self.assertEqual(mock_get_template.return_value.render.call_count, 2)
+
+    def test_template_cache_cleared_on_setting_change(self):
+        """Test that resolved templates are dropped when settings change."""
+        BasicSpellBlock._template_cache['test_template.html'] = Mock()
+
+        with self.settings(TEMPLATES=[]):
+            self.assertEqual(BasicSpellBlock._template_cache, {})
+
+    @patch('django_spellbook.markdown.engine.SpellbookMarkdownEngine')
+    def test_render_many_shares_engine(self, mock_engine_class):
+        """Test that render_many renders every block through one shared engine."""
+        mock_engine_class.return_value.parse_and_render.side_effect = lambda text: f'<p>{text}</p>'
+        reporter = MarkdownReporter(StringIO())
+        blocks = [
+            self.BlockClass(reporter, 'First', **self.test_kwargs),
+            self.BlockClass(reporter, 'Second', **self.test_kwargs),
+        ]
+
+        with patch('django_spellbook.blocks.base.get_template') as mock_get_template:
+            mock_get_template.return_value.render.side_effect = lambda context: context['content']
+            rendered = BasicSpellBlock.render_many(blocks)
+
+        self.assertEqual(rendered, ['<p>First</p>', '<p>Second</p>'])
+        mock_engine_class.assert_called_once_with(reporter=reporter)
+        mock_get_template.assert_called_once_with('test_template.html')
+
     def test_render_no_template(self):
         """Test rendering without a template raises ValueError."""
         class NoTemplateBlock(BasicSpellBlock):
@@ -143,13 +186,56 @@ class TestBasicSpellBlock(TestCase):
         self.assertEqual(block.required_kwargs, {'custom_required'})
         self.assertEqual(block.optional_kwargs, {'custom_optional'})
 
+    def test_process_content_reuses_parent_engine(self):
+        """Test that nested content is rendered by the engine that owns the block."""
+        engine = Mock()
+        engine.parse_and_render.return_value = '<p>Nested</p>'
+        block = self.BlockClass(
+            MarkdownReporter(StringIO()), self.test_content, spellbook_parser=engine
+        )
+
+        self.assertEqual(block.process_content(), '<p>Nested</p>')
+        engine.parse_and_render.assert_called_once_with(self.test_content)
+
+    @patch('django_spellbook.parsers.spellbook_render', return_value='<p>Plain</p>')
+    def test_plain_content_is_memoized(self, mock_render):
+        """Test that identical plain markdown is only rendered once."""
+        first = self.BlockClass(MarkdownReporter(StringIO()), 'Plain')
+        second = self.BlockClass(MarkdownReporter(StringIO()), 'Plain')
+
+        self.assertEqual(first.process_content(), '<p>Plain</p>')
+        self.assertEqual(second.process_content(), '<p>Plain</p>')
+        mock_render.assert_called_once_with('Plain')
+
+    @patch('django_spellbook.parsers.spellbook_render', return_value='<div>Nested</div>')
+    def test_content_with_spellblocks_is_not_memoized(self, mock_render):
+        """Test that content containing SpellBlocks is rendered every time."""
+        reporter = MarkdownReporter(StringIO())
+        content = '{~ alert ~}Hi{~~}'
+        self.BlockClass(reporter, content).process_content()
+        self.BlockClass(reporter, content).process_content()
+
+        self.assertEqual(mock_render.call_count, 2)
+
+    def test_metadata_defaults(self):
+        """Test class-level metadata defaults for blocks that don't override them."""
+        class BareBlock(BasicSpellBlock):
+            pass
+
+        block = BareBlock(MarkdownReporter(StringIO()), 'content')
+        self.assertIsNone(block.name)
+        self.assertIsNone(block.template)
+        self.assertEqual(block.required_kwargs, frozenset())
+        self.assertEqual(block.optional_kwargs, frozenset())
+        self.assertNotIn('name', block.__dict__)
+
     def test_none_content_handling(self):
         """Test handling of None content."""
         block = self.BlockClass(None)
         processed_content = block.process_content()
         self.assertEqual(processed_content, '')
 
-    @patch('markdown.markdown')
+    @patch('markdown.Markdown')
     def test_markdown_extensions(self, mock_markdown):
         """Test that markdown extensions are properly configured."""
         block = self.BlockClass(MarkdownReporter(StringIO()), self.test_content)
@@ -48,6 +48,36 @@ class TestSpellBlockRegistry(TestCase):
         self.assertIn('must inherit from BasicSpellBlock',
                       str(context.exception))
 
+    def test_non_class_registration(self):
+        """Test registration of something that is not a class."""
+        def not_a_block():
+            pass
+
+        with self.assertRaises(BlockRegistrationError) as context:
+            SpellBlockRegistry.register(name='func')(not_a_block)
+
+        self.assertIn('must inherit from BasicSpellBlock',
+                      str(context.exception))
+        self.assertNotIn('func', SpellBlockRegistry._registry)
+
+    def test_non_class_object_registration(self):
+        """Test registration of an object without a __name__."""
+        with self.assertRaises(BlockRegistrationError) as context:
+            SpellBlockRegistry.register(name='instance')(object())
+
+        self.assertIn('must inherit from BasicSpellBlock',
+                      str(context.exception))
+
+    def test_unhashable_name(self):
+        """Test registration with a name that can't be a registry key."""
+        with self.assertRaises(BlockRegistrationError) as context:
+            @SpellBlockRegistry.register(name=['not', 'hashable'])
+            class ListNameBlock(BasicSpellBlock):
+                template = 'test.html'
+
+        self.assertIn('must be hashable', str(context.exception))
+        self.assertIsInstance(context.exception.__cause__, TypeError)
+
     def test_missing_name(self):
         """Test registration with missing block name."""
         with self.assertRaises(BlockRegistrationError) as context:
@@ -90,6 +120,25 @@ class TestSpellBlockRegistry(TestCase):
         block_class = SpellBlockRegistry.get_block('non_existent')
         self.assertIsNone(block_class)
 
+    def test_all_blocks_in_registration_order(self):
+        """Test that all_blocks lists blocks in the order they were registered."""
+        @SpellBlockRegistry.register()
+        class ZetaBlock(BasicSpellBlock):
+            name = 'zeta'
+
+        @SpellBlockRegistry.register()
+        class AlphaBlock(BasicSpellBlock):
+            name = 'alpha'
+
+        # A failed registration does not add an entry
+        with self.assertRaises(BlockRegistrationError):
+            SpellBlockRegistry.register(name='zeta')(AlphaBlock)
+
+        self.assertEqual(
+            SpellBlockRegistry.all_blocks(),
+            [('zeta', ZetaBlock), ('alpha', AlphaBlock)]
+        )
+
     @patch('django_spellbook.blocks.registry.logger')
     def test_registration_logging(self, mock_logger):
         """Test logging during block registration."""
@@ -100,7 +149,7 @@ class TestSpellBlockRegistry(TestCase):
             template = 'test.html'
 
         mock_logger.debug.assert_called_with(
-            "Successfully registered block: test_block")
+            "Successfully registered block: %s", "test_block")
 
         # Test error logging
         mock_logger.reset_mock()
@@ -109,7 +158,11 @@ class TestSpellBlockRegistry(TestCase):
             class InvalidBlock:
                 name = 'invalid_block'
 
-        mock_logger.error.assert_called_once()
+        mock_logger.error.assert_called_once_with(
+            "Error registering block %s: %s",
+            'InvalidBlock',
+            'Block class InvalidBlock must inherit from BasicSpellBlock'
+        )
 
     def test_registration_with_custom_name_override(self):
         """Test registration with custom name overriding class name."""
@@ -60,6 +60,15 @@ class TestNormalizeSettings(TestCase):
         self.assertEqual(md_apps, ['app1', 'app2'])
         self.assertEqual(base_templates, ["template", "template"])
 
+    def test_normalize_without_apps(self):
+        """Test base templates when no content app is configured."""
+        _, md_apps, base_templates = normalize_settings('/test/path', None, None)
+        self.assertIsNone(md_apps)
+        self.assertEqual(base_templates, ['django_spellbook/bases/sidebar_left.html'])
+
+        _, _, base_templates = normalize_settings('/test/path', None, 'template')
+        self.assertEqual(base_templates, [])
+
 
 class TestValidateSpellbookSettings(TestCase):
     """Tests for validate_spellbook_settings function."""
@@ -101,6 +110,31 @@ class TestValidateSpellbookSettings(TestCase):
         
         self.assertIn("Missing required settings", str(context.exception))
 
+    @override_settings(
+        SPELLBOOK_MD_PATH='/test/path',
+        SPELLBOOK_MD_APP='test_app'
+    )
+    def test_settings_validated_once_until_changed(self):
+        """Test that validation is cached until settings change."""
+        with patch(
+            'django_spellbook.management.commands.command_utils._validate_setting_values'
+        ) as mock_validate:
+            first = validate_spellbook_settings()
+            second = validate_spellbook_settings()
+
+            self.assertEqual(first, second)
+            mock_validate.assert_called_once()
+
+            # Callers get their own lists
+            first[0].append('/other')
+            self.assertEqual(validate_spellbook_settings()[0], ['/test/path'])
+
+            with self.settings(SPELLBOOK_MD_PATH='/new/path'):
+                md_paths = validate_spellbook_settings()[0]
+
+            self.assertEqual(md_paths, ['/new/path'])
+            self.assertEqual(mock_validate.call_count, 2)
+
 
 class TestValidateSettingValues(TestCase):
     """Tests for _validate_setting_values function."""
@@ -184,16 +218,27 @@ class TestValidateSettingValues(TestCase):
             [None, None]
         )
 
+    def test_installed_app_names_include_dotted_prefixes(self):
+        """Test apps and dotted apps are found through their AppConfig paths."""
+        from django_spellbook.management.commands.command_utils import _installed_app_names
+        names = _installed_app_names(['blog.apps.BlogConfig', 'site.docs.apps.DocsConfig', 'blogging'])
+
+        self.assertIn('blog', names)
+        self.assertIn('site.docs', names)
+        self.assertIn('blogging', names)
+        self.assertNotIn('blo', names)
+        self.assertNotIn('docs', names)
+
 
 class TestSetupDirectoryStructure(TestCase):
     """Tests for setup_directory_structure function."""
 
-    @patch('os.path.exists')
+    @patch.object(Path, 'is_dir', autospec=True)
     @patch('django_spellbook.management.commands.command_utils.setup_template_directory')
-    def test_successful_setup(self, mock_setup_template, mock_exists):
+    def test_successful_setup(self, mock_setup_template, mock_is_dir):
         """Test successful directory structure setup."""
         # Setup mocks
-        mock_exists.return_value = True
+        mock_is_dir.return_value = True
         mock_setup_template.return_value = '/test/app/templates/test_app/spellbook_md'
         
         # Call function
@@ -204,14 +249,14 @@ class TestSetupDirectoryStructure(TestCase):
         self.assertEqual(template_dir, '/test/app/templates/test_app/spellbook_md')
         
         # Verify correct function calls
-        mock_exists.assert_called_once_with('/test/content/test_app')
+        mock_is_dir.assert_called_once_with(Path('/test/content/test_app'))
         mock_setup_template.assert_called_once_with('/test/content/test_app', 'test_app')
     
-    @patch('os.path.exists')
-    def test_content_app_not_found(self, mock_exists):
+    @patch.object(Path, 'is_dir', autospec=True)
+    def test_content_app_not_found(self, mock_is_dir):
         """Test error when content app is not found."""
         # Setup mocks
-        mock_exists.return_value = False
+        mock_is_dir.return_value = False
         
         # Call function
         with self.assertRaises(CommandError) as context:
@@ -220,12 +265,12 @@ class TestSetupDirectoryStructure(TestCase):
         # Verify error message
         self.assertIn("Content app test_app not found", str(context.exception))
     
-    @patch('os.path.exists')
+    @patch.object(Path, 'is_dir', autospec=True)
     @patch('django_spellbook.management.commands.command_utils.setup_template_directory')
-    def test_setup_template_error(self, mock_setup_template, mock_exists):
+    def test_setup_template_error(self, mock_setup_template, mock_is_dir):
         """Test error when template directory setup fails."""
         # Setup mocks
-        mock_exists.return_value = True
+        mock_is_dir.return_value = True
         mock_setup_template.side_effect = Exception("Template directory error")
         
         # Call function
@@ -296,6 +341,20 @@ class TestGetFolderList(unittest.TestCase):
         
         # Verify result
         self.assertEqual(folders, ['file.md'])
+
+    def test_get_folder_list_source_dir_itself(self):
+        """Test that the source directory itself has no folders."""
+        self.assertEqual(get_folder_list('/test/content', '/test/content'), [])
+
+    def test_get_folder_list_repeated_source_name(self):
+        """Test that the innermost component matching the source name is used."""
+        folders = get_folder_list('/docs/guide/docs/api', '/srv/docs')
+        self.assertEqual(folders, ['api'])
+
+    def test_get_folder_list_source_with_trailing_slash(self):
+        """Test that a trailing slash on the source path is ignored."""
+        folders = get_folder_list('/test/content/sub', '/test/content/')
+        self.assertEqual(folders, ['sub'])
         
         
 class TestLogAndWrite(unittest.TestCase):
@@ -714,4 +773,15 @@ class TestValidateSettingValuesWithDangerousTemplates(TestCase):
         from django_spellbook.management.commands.command_utils import _validate_base_templates
         with self.assertRaises(CommandError) as context:
             _validate_base_templates(['valid.html', '../traversal.html', 'also_valid.html'])
-        self.assertIn("dangerous characters", str(context.exception).lower())
\ No newline at end of file
+        self.assertIn("dangerous characters", str(context.exception).lower())
+
+    @override_settings(TESTING=True)
+    def test_every_dangerous_pattern_is_rejected(self):
+        """Test the compiled pattern catches each configured dangerous substring."""
+        from django_spellbook.management.commands.command_utils import (
+            _validate_base_templates, _DANGEROUS_TEMPLATE
+        )
+        for pattern in _DANGEROUS_TEMPLATE:
+            with self.subTest(pattern=pattern):
+                with self.assertRaises(CommandError):
+                    _validate_base_templates([f'theme{pattern}base.html'])
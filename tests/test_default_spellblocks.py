@@ -2,6 +2,7 @@ import unittest
 from unittest.mock import patch, Mock
 from django.test import TestCase  # Use Django's TestCase
 from django.template.loader import get_template
+from django_spellbook.blocks import BasicSpellBlock
 from django_spellbook.spellblocks import AlertBlock, CardBlock
 
 from django_spellbook.management.commands.spellbook_md_p.reporter import MarkdownReporter
@@ -11,6 +12,8 @@ from io import StringIO
 class TestAlertBlock(TestCase):  # Change to Django's TestCase
     def setUp(self):
         self.alert_block = AlertBlock(MarkdownReporter(StringIO()))
+        BasicSpellBlock._template_cache.clear()
+        self.addCleanup(BasicSpellBlock._template_cache.clear)
 
     def test_initialization(self):
         """Test basic initialization of AlertBlock"""
@@ -50,9 +53,10 @@ class TestAlertBlock(TestCase):  # Change to Django's TestCase
         self.assertEqual(context['type'], 'info')  # default type
 
     # Patch at the correct location
-    @patch('django_spellbook.blocks.base.render_to_string')
-    def test_alert_rendering(self, mock_render):
+    @patch('django_spellbook.blocks.base.get_template')
+    def test_alert_rendering(self, mock_get_template):
         """Test alert template rendering"""
+        mock_render = mock_get_template.return_value.render
         mock_render.return_value = "<div>Rendered content</div>"
 
         block = AlertBlock(
@@ -62,8 +66,8 @@ class TestAlertBlock(TestCase):  # Change to Django's TestCase
         )
         result = block.render()
 
+        mock_get_template.assert_called_once_with('django_spellbook/blocks/alert.html')
         mock_render.assert_called_once_with(
-            'django_spellbook/blocks/alert.html',
             {
                 'content': '<p>Test content</p>',
                 'type': 'warning'
@@ -75,6 +79,8 @@ class TestAlertBlock(TestCase):  # Change to Django's TestCase
 class TestCardBlock(TestCase):  # Change to Django's TestCase
     def setUp(self):
         self.card_block = CardBlock(reporter=MarkdownReporter(StringIO()))
+        BasicSpellBlock._template_cache.clear()
+        self.addCleanup(BasicSpellBlock._template_cache.clear)
 
     def test_initialization(self):
         """Test basic initialization of CardBlock"""
@@ -123,9 +129,10 @@ class TestCardBlock(TestCase):  # Change to Django's TestCase
         self.assertIn("<li>\n<p>List item 2</p>", context['content'])
 
     # Patch at the correct location
-    @patch('django_spellbook.blocks.base.render_to_string')
-    def test_card_rendering(self, mock_render):
+    @patch('django_spellbook.blocks.base.get_template')
+    def test_card_rendering(self, mock_get_template):
         """Test card template rendering"""
+        mock_render = mock_get_template.return_value.render
         mock_render.return_value = "<div>Rendered card</div>"
 
         block = CardBlock(
@@ -137,8 +144,8 @@ class TestCardBlock(TestCase):  # Change to Django's TestCase
         )
         result = block.render()
 
+        mock_get_template.assert_called_once_with('django_spellbook/blocks/card.html')
         mock_render.assert_called_once_with(
-            'django_spellbook/blocks/card.html',
             {
                 'content': '<p>Test content</p>',
                 'title': 'Test Title',
@@ -66,10 +66,10 @@ class TestDirectoryIndexBuilder(TestCase):
         groups = self.builder._group_by_directory([pf1, pf2, pf3])
 
         self.assertEqual(len(groups), 2)
-        self.assertIn(Path("content/docs"), groups)
-        self.assertIn(Path("content/api"), groups)
-        self.assertEqual(len(groups[Path("content/docs")]), 2)
-        self.assertEqual(len(groups[Path("content/api")]), 1)
+        self.assertIn("content/docs", groups)
+        self.assertIn("content/api", groups)
+        self.assertEqual(len(groups["content/docs"]), 2)
+        self.assertEqual(len(groups["content/api"]), 1)
 
     def test_detects_subdirectories(self):
         """Subdirectories are detected and counted correctly."""
@@ -79,7 +79,7 @@ class TestDirectoryIndexBuilder(TestCase):
         pf4 = self._create_processed_file("/content/docs/guide.md")
 
         subdirs = self.builder._detect_subdirectories(
-            Path("content/docs"),
+            "content/docs",
             [pf1, pf2, pf3, pf4]
         )
 
@@ -104,7 +104,7 @@ class TestDirectoryIndexBuilder(TestCase):
             'pages': [{'title': 'Guide', 'url': '/docs/guide/', 'published': None, 'modified': None, 'tags': [], 'description': None}]
         }
 
-        view_func = self.builder._generate_view_function(Path("docs"), context_data)
+        view_func = self.builder._generate_view_function("docs", context_data)
 
         self.assertIn('def directory_index_docs(request):', view_func)
         self.assertIn("render(request, 'django_spellbook/directory_index/default.html', context)", view_func)
@@ -112,7 +112,7 @@ class TestDirectoryIndexBuilder(TestCase):
 
     def test_generates_url_pattern(self):
         """URL pattern code is valid Django pattern."""
-        url_pattern = self.builder._generate_url_pattern(Path("docs"))
+        url_pattern = self.builder._generate_url_pattern("docs")
 
         # With url_prefix='docs' and directory='docs', the prefix is removed from path
         # since it will be added by include() in main urls.py
@@ -129,7 +129,7 @@ class TestDirectoryIndexBuilder(TestCase):
         pf2 = self._create_processed_file("content/docs/guide.md", relative_url="content/docs/guide")
 
         has_conflict = self.builder._has_index_conflict(
-            Path("content/docs"),
+            "content/docs",
             [pf1, pf2]
         )
 
@@ -141,12 +141,26 @@ class TestDirectoryIndexBuilder(TestCase):
         pf2 = self._create_processed_file("/content/docs/tutorial.md")
 
         has_conflict = self.builder._has_index_conflict(
-            Path("content/docs"),
+            "content/docs",
             [pf1, pf2]
         )
 
         self.assertFalse(has_conflict)
 
+    def test_grouping_collects_index_conflicts(self):
+        """Conflicts are found while grouping, and those directories get no index."""
+        # With url_prefix='docs', a root-level 'docs' page claims the root index URL
+        pf1 = self._create_processed_file("docs.md", relative_url="docs")
+        pf2 = self._create_processed_file("guides/a.md", relative_url="guides/a")
+
+        conflicts = set()
+        self.builder._group_by_directory([pf1, pf2], conflicts)
+        self.assertEqual(conflicts, {''})
+
+        views, urls = self.builder.build_indexes([pf1, pf2])
+        self.assertEqual(len(views), 1)
+        self.assertIn('directory_index_guides', views[0])
+
     def test_alphabetical_sorting(self):
         """Subdirectories and pages are sorted alphabetically."""
         pf1 = self._create_processed_file("/content/docs/zebra.md", title="Zebra")
@@ -159,6 +173,26 @@ class TestDirectoryIndexBuilder(TestCase):
         self.assertEqual(pages[1]['title'], 'Middle')
         self.assertEqual(pages[2]['title'], 'Zebra')
 
+    def test_page_sorting_ignores_case_and_keeps_ties_stable(self):
+        """Pages sort case-insensitively and equal titles keep their order."""
+        pf1 = self._create_processed_file("/content/docs/b.md", title="beta")
+        pf2 = self._create_processed_file("/content/docs/a1.md", title="Alpha")
+        pf3 = self._create_processed_file("/content/docs/a2.md", title="alpha")
+
+        pages = self.builder._collect_page_metadata([pf1, pf2, pf3])
+
+        self.assertEqual([p['title'] for p in pages], ['Alpha', 'alpha', 'beta'])
+        self.assertEqual(pages[1]['url'], 'docs/content/docs/a2/')
+
+    def test_page_sorting_casefolds_titles(self):
+        """Titles that only match under full case folding still sort together."""
+        pf1 = self._create_processed_file("/content/docs/c.md", title="Strasse B")
+        pf2 = self._create_processed_file("/content/docs/a.md", title="Straße A")
+
+        pages = self.builder._collect_page_metadata([pf1, pf2])
+
+        self.assertEqual([p['title'] for p in pages], ['Straße A', 'Strasse B'])
+
     def test_metadata_extraction(self):
         """Page metadata is extracted correctly."""
         published_date = datetime(2025, 12, 8)
@@ -213,6 +247,27 @@ class TestDirectoryIndexBuilder(TestCase):
 
         self.assertEqual(pages[0]['title'], 'My Guide')  # Fallback to filename (with spaces)
 
+    def test_title_fallback_with_string_path(self):
+        """Falls back to filename when original_path is a plain string."""
+        context = SpellbookContext(
+            title=None,
+            url_path="setup_notes",
+            raw_content="Test",
+            is_public=True
+        )
+
+        pf = ProcessedFile(
+            original_path="/content/docs/setup_notes.md",
+            html_content="<p>Test</p>",
+            template_path=Path("/templates/setup_notes.html"),
+            relative_url="setup_notes",
+            context=context
+        )
+
+        pages = self.builder._collect_page_metadata([pf])
+
+        self.assertEqual(pages[0]['title'], 'Setup Notes')
+
     def test_url_prefix_handling(self):
         """URL prefix is NOT included (added by include() in main urls)."""
         builder = DirectoryIndexBuilder('test_app', 'docs')
@@ -223,6 +278,12 @@ class TestDirectoryIndexBuilder(TestCase):
         # No prefix, no leading slash (will be added by include())
         self.assertEqual(page_url, 'guide/')
 
+        # Multi-segment prefixes are stripped as a whole
+        builder = DirectoryIndexBuilder('test_app', 'api/v1')
+        self.assertEqual(builder._build_page_url('api/v1/intro'), 'intro/')
+        self.assertEqual(builder._build_page_url('api/v1'), '')
+        self.assertEqual(builder._build_page_url('api/v10/intro'), 'api/v10/intro/')
+
     def test_nested_directories(self):
         """Multi-level nesting works correctly."""
         pf1 = self._create_processed_file("/content/docs/api/v1/endpoints.md")
@@ -231,9 +292,81 @@ class TestDirectoryIndexBuilder(TestCase):
 
         groups = self.builder._group_by_directory([pf1, pf2, pf3])
 
-        self.assertIn(Path("content/docs/api/v1"), groups)
-        self.assertIn(Path("content/docs/api/v2"), groups)
-        self.assertIn(Path("content/docs/api"), groups)
+        self.assertIn("content/docs/api/v1", groups)
+        self.assertIn("content/docs/api/v2", groups)
+        self.assertIn("content/docs/api", groups)
+
+    def test_index_subdirectories_counts_nested_pages(self):
+        """Each directory maps its immediate children to recursive page counts."""
+        pf1 = self._create_processed_file("intro.md", relative_url="intro")
+        pf2 = self._create_processed_file("api/v1/endpoints.md", relative_url="api/v1/endpoints")
+        pf3 = self._create_processed_file("api/auth.md", relative_url="api/auth")
+
+        index = self.builder._index_subdirectories(
+            self.builder._group_by_directory([pf1, pf2, pf3])
+        )
+
+        self.assertEqual(index[''], {'api': 2})
+        self.assertEqual(index['api'], {'v1': 1})
+        self.assertNotIn('api/v1', index)
+
+    def test_stats_exclude_sibling_with_shared_prefix(self):
+        """A directory's subtree doesn't include siblings that share a name prefix."""
+        pf1 = self._create_processed_file("doc/a.md", relative_url="doc/a")
+        pf2 = self._create_processed_file("docs/b.md", relative_url="docs/b")
+
+        stats = self.builder._calculate_directory_stats('doc', [pf1], [pf1, pf2])
+
+        self.assertEqual(stats['total_pages'], 1)
+
+    def test_stats_use_precomputed_indexes(self):
+        """Stats come from the precomputed indexes without scanning other directories."""
+        pf1 = self._create_processed_file("guides/a.md", relative_url="guides/a")
+        pf2 = self._create_processed_file("guides/b.md", relative_url="guides/b")
+        groups = Mock()
+        groups.items.side_effect = AssertionError("stats scanned all directories")
+
+        stats = self.builder._calculate_directory_stats(
+            'guides', [pf1, pf2], [pf1, pf2],
+            {'': {'guides': 5}, 'guides': {'advanced': 3}}, groups,
+            {'guides': datetime(2025, 1, 2)}
+        )
+
+        self.assertEqual(stats['total_pages'], 5)
+        self.assertEqual(stats['subdirectory_count'], 1)
+        self.assertEqual(stats['last_updated'], datetime(2025, 1, 2))
+
+    def test_index_latest_dates_covers_ancestors(self):
+        """Each directory gets the latest date found anywhere below it."""
+        pf1 = self._create_processed_file("a.md", relative_url="a", published=datetime(2025, 1, 1))
+        pf2 = self._create_processed_file("guides/b.md", relative_url="guides/b", published=datetime(2025, 3, 1))
+        pf3 = self._create_processed_file("guides/x/c.md", relative_url="guides/x/c", published=datetime(2025, 2, 1))
+        pf4 = self._create_processed_file("other/d.md", relative_url="other/d")
+
+        latest = self.builder._index_latest_dates(
+            self.builder._group_by_directory([pf1, pf2, pf3, pf4])
+        )
+
+        self.assertEqual(latest, {
+            '': datetime(2025, 3, 1),
+            'guides': datetime(2025, 3, 1),
+            'guides/x': datetime(2025, 2, 1),
+        })
+
+    def test_url_and_name_helpers_are_memoized(self):
+        """Repeated directories reuse the builder's cached helper results."""
+        pf1 = self._create_processed_file("guides/a.md", relative_url="guides/a")
+        pf2 = self._create_processed_file("guides/b.md", relative_url="guides/b")
+
+        self.builder.build_indexes([pf1, pf2])
+
+        self.assertGreater(self.builder._generate_view_name.cache_info().hits, 0)
+        self.assertGreater(self.builder._build_directory_url.cache_info().hits, 0)
+
+        # Caches belong to the instance, so other builders start fresh
+        other = DirectoryIndexBuilder('other_app')
+        self.assertEqual(other._generate_view_name.cache_info().currsize, 0)
+        self.assertEqual(other._generate_view_name(''), 'directory_index_root_other_app')
 
     def test_build_indexes_returns_views_and_urls(self):
         """build_indexes returns both view functions and URL patterns."""
@@ -256,15 +389,15 @@ class TestDirectoryIndexBuilder(TestCase):
     def test_humanize_directory_name(self):
         """Directory names are humanized correctly."""
         self.assertEqual(
-            self.builder._humanize_directory_name(Path("getting-started")),
+            self.builder._humanize_directory_name("getting-started"),
             "Getting Started"
         )
         self.assertEqual(
-            self.builder._humanize_directory_name(Path("api-reference")),
+            self.builder._humanize_directory_name("api-reference"),
             "API Reference"
         )
         self.assertEqual(
-            self.builder._humanize_directory_name(Path("faq")),
+            self.builder._humanize_directory_name("faq"),
             "FAQ"
         )
 
@@ -272,7 +405,7 @@ class TestDirectoryIndexBuilder(TestCase):
         """Directory URLs are built correctly with prefix."""
         builder = DirectoryIndexBuilder('test_app', 'docs')
 
-        url = builder._build_directory_url(Path("guides"))
+        url = builder._build_directory_url("guides")
 
         # No leading slash, no prefix (added by include())
         self.assertEqual(url, 'guides/')
@@ -281,16 +414,23 @@ class TestDirectoryIndexBuilder(TestCase):
         """Directory URLs work without prefix."""
         builder = DirectoryIndexBuilder('test_app', '')
 
-        url = builder._build_directory_url(Path("guides"))
+        url = builder._build_directory_url("guides")
 
         # No leading slash, no prefix
         self.assertEqual(url, 'guides/')
 
+    def test_add_url_prefix(self):
+        """Navigation URLs get the prefix exactly once; the root becomes the prefix."""
+        self.assertEqual(self.builder._add_url_prefix('guides/'), 'docs/guides/')
+        self.assertEqual(self.builder._add_url_prefix('docs/guides/'), 'docs/guides/')
+        self.assertEqual(self.builder._add_url_prefix(''), 'docs/')
+        self.assertEqual(DirectoryIndexBuilder('test_app')._add_url_prefix('guides/'), 'guides/')
+
     def test_root_directory_url(self):
         """Root directory URL is handled correctly."""
         builder = DirectoryIndexBuilder('test_app', 'docs')
 
-        url = builder._build_directory_url(Path("."))
+        url = builder._build_directory_url('')
 
         # Empty string for root (will be at include prefix)
         self.assertEqual(url, '')
@@ -301,7 +441,7 @@ class TestDirectoryIndexBuilder(TestCase):
         pf2 = self._create_processed_file("/content/docs/tutorial.md")
 
         context = self.builder._collect_directory_context(
-            Path("content/docs"),
+            "content/docs",
             [pf1, pf2],
             [pf1, pf2]
         )
@@ -317,6 +457,27 @@ class TestDirectoryIndexBuilder(TestCase):
             'pages': []
         }
 
-        view_func = self.builder._generate_view_function(Path("docs"), context_data)
+        view_func = self.builder._generate_view_function("docs", context_data)
 
         self.assertIn("context['toc'] = TOC", view_func)
+
+    def test_context_literal_round_trips(self):
+        """Generated context literal evaluates back to the original context."""
+        import datetime as datetime_module
+        context_data = {
+            'directory_name': 'Docs',
+            'parent_dir_url': None,
+            'subdirectories': [{'title': 'API', 'url': 'docs/api/', 'page_count': 2}],
+            'pages': [{
+                'title': "It's here",
+                'published': datetime(2025, 12, 8),
+                'tags': ['intro', 'basics'],
+            }],
+            'directory_stats': {'total_pages': 3, 'last_updated': None},
+            'is_directory_index': True,
+        }
+
+        literal = self.builder._dict_to_python_literal(context_data)
+
+        self.assertEqual(eval(literal, {'datetime': datetime_module}), context_data)
+        self.assertIn("\n        {'title': 'API', 'url': 'docs/api/', 'page_count': 2},\n", literal)
@@ -48,7 +48,7 @@ class TestDirectoryStatsCalculation(TestCase):
         ]
 
         stats = self.builder._calculate_directory_stats(
-            Path('.'), files, all_files
+            '', files, all_files
         )
 
         self.assertEqual(stats['direct_pages'], 3)
@@ -67,7 +67,7 @@ class TestDirectoryStatsCalculation(TestCase):
         ]
 
         stats = self.builder._calculate_directory_stats(
-            Path('.'), files, all_files
+            '', files, all_files
         )
 
         # Root directory contains all 5 files
@@ -86,7 +86,7 @@ class TestDirectoryStatsCalculation(TestCase):
         ]
 
         stats = self.builder._calculate_directory_stats(
-            Path('advanced'), files, all_files
+            'advanced', files, all_files
         )
 
         # advanced/ directory contains 2 files (topics and deep/nested)
@@ -106,7 +106,7 @@ class TestDirectoryStatsCalculation(TestCase):
         ]
 
         stats = self.builder._calculate_directory_stats(
-            Path('.'), files, files
+            '', files, files
         )
 
         self.assertEqual(stats['last_updated'], date2)
@@ -122,7 +122,7 @@ class TestDirectoryStatsCalculation(TestCase):
         ]
 
         stats = self.builder._calculate_directory_stats(
-            Path('.'), files, files
+            '', files, files
         )
 
         self.assertEqual(stats['last_updated'], published2)
@@ -138,7 +138,7 @@ class TestDirectoryStatsCalculation(TestCase):
         ]
 
         stats = self.builder._calculate_directory_stats(
-            Path('.'), files, files
+            '', files, files
         )
 
         self.assertEqual(stats['last_updated'], published_date)
@@ -151,7 +151,7 @@ class TestDirectoryStatsCalculation(TestCase):
         ]
 
         stats = self.builder._calculate_directory_stats(
-            Path('.'), files, files
+            '', files, files
         )
 
         self.assertIsNone(stats['last_updated'])
@@ -170,7 +170,7 @@ class TestDirectoryStatsCalculation(TestCase):
         ]
 
         stats = self.builder._calculate_directory_stats(
-            Path('.'), files, all_files
+            '', files, all_files
         )
 
         # Root has 3 immediate subdirectories: guides, advanced, reference
@@ -179,7 +179,7 @@ class TestDirectoryStatsCalculation(TestCase):
     def test_empty_directory_stats(self):
         """Empty directory returns zeros/None."""
         stats = self.builder._calculate_directory_stats(
-            Path('.'), [], []
+            '', [], []
         )
 
         self.assertEqual(stats['total_pages'], 0)
@@ -196,7 +196,7 @@ class TestDirectoryStatsCalculation(TestCase):
         ]
 
         stats = self.builder._calculate_directory_stats(
-            Path('.'), files, files
+            '', files, files
         )
 
         # Both files should be counted
@@ -388,7 +388,7 @@ class TestDirectoryMetadataDevView(TestCase):
         )
 
         result = builder._collect_directory_context(
-            Path("docs/guides"),
+            "docs/guides",
             [pf],
             [pf]
         )
@@ -474,7 +474,7 @@ class TestDirectoryContextIntegration(TestCase):
         ]
 
         context = self.builder._collect_directory_context(
-            Path('.'), files, all_files
+            '', files, all_files
         )
 
         self.assertIn('directory_stats', context)
@@ -496,7 +496,7 @@ class TestDirectoryContextIntegration(TestCase):
         ]
 
         context = self.builder._collect_directory_context(
-            Path('.'), files, all_files
+            '', files, all_files
         )
 
         stats = context['directory_stats']
@@ -7,6 +7,7 @@ from pathlib import Path
 from unittest.mock import Mock, patch, mock_open, MagicMock
 from django.test import TestCase
 
+from django_spellbook.management.commands.processing import manifest as manifest_module
 from django_spellbook.management.commands.processing.manifest import ManifestGenerator
 from django_spellbook.management.commands.processing.file_processor import ProcessedFile
 from django_spellbook.markdown.context import SpellbookContext
@@ -155,6 +156,21 @@ class TestManifestGeneration(TestCase):
 
         self.assertEqual(manifest['pages'][0]['path'], '/docs/guide/')
 
+    def test_page_entry_paths(self):
+        """Page paths get exactly one slash between and around their parts."""
+        cases = [
+            ('docs', 'guide', '/docs/guide/'),
+            ('docs', '/nested/guide/', '/docs/nested/guide/'),
+            ('docs', '', '/docs/'),
+            ('', 'guide', '/guide/'),
+            ('', '', '/'),
+        ]
+        for url_prefix, url_path, expected in cases:
+            with self.subTest(url_prefix=url_prefix, url_path=url_path):
+                pf = self._create_processed_file(url_path=url_path)
+                entry = self.generator._build_page_entry(pf, url_prefix)
+                self.assertEqual(entry['path'], expected)
+
     def test_generate_with_empty_list(self):
         """Test generate with empty processed files list."""
         result = self.generator.generate([], self.app_name, self.output_dir)
@@ -173,6 +189,24 @@ class TestManifestGeneration(TestCase):
         self.assertIsNone(result)
         mock_file.assert_not_called()
 
+    @unittest.skipUnless(manifest_module.orjson, "orjson is not installed")
+    @patch('pathlib.Path.mkdir')
+    def test_manifest_same_with_and_without_orjson(self, mock_mkdir):
+        """The stdlib fallback writes exactly what the optional orjson path writes."""
+        pf = self._create_processed_file(title="Café", modified=datetime(2025, 1, 15))
+
+        outputs = []
+        for encoder in (manifest_module.orjson, None):
+            with patch.object(manifest_module, 'orjson', encoder), \
+                    patch('builtins.open', new_callable=mock_open) as mock_file:
+                self.generator._write_manifest({'app_name': self.app_name, 'pages': [
+                    self.generator._build_page_entry(pf, 'docs')
+                ]}, self.output_dir)
+            outputs.append(''.join(call.args[0] for call in mock_file().write.call_args_list))
+
+        self.assertEqual(len(set(outputs)), 1)
+        self.assertEqual(json.loads(outputs[0])['pages'][0]['title'], "Café")
+
 
 class TestSpellbookSitemap(TestCase):
     """Test Django Sitemap integration."""
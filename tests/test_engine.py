@@ -10,7 +10,7 @@ from django.template.exceptions import TemplateDoesNotExist
 import django # For django.setup()
 
 # Your application imports
-from django_spellbook.markdown.engine import SpellbookMarkdownEngine
+from django_spellbook.markdown.engine import SpellbookMarkdownEngine, is_plain_text
 from django_spellbook.blocks import BasicSpellBlock, SpellBlockRegistry
 from django_spellbook.management.commands.spellbook_md_p.reporter import MarkdownReporter
 
@@ -168,6 +168,37 @@ class TestSpellbookMarkdownEngine(unittest.TestCase):
         engine = SpellbookMarkdownEngine(reporter=self.reporter, markdown_extensions=custom_exts)
         self.assertEqual(engine.markdown_extensions, custom_exts)
 
+    def test_markdown_parser_reused_between_renders(self):
+        """Test that the python-markdown parser is built once and reset between renders."""
+        first_md = self.engine._get_markdown()
+        html_with_footnote = self.engine.parse_and_render("Text[^1]\n\n[^1]: A note.")
+        html_plain = self.engine.parse_and_render("Plain text.")
+
+        self.assertIs(self.engine._get_markdown(), first_md)
+        self.assertIn('class="footnote"', html_with_footnote)
+        self.assertEqual(html_plain, "<p>Plain text.</p>")
+
+    def test_plain_text_detection(self):
+        """Test which strings qualify for the plain-text shortcut."""
+        for text in ["Hello world", "It's 50% off (today): yes/no?", "Trailing space "]:
+            self.assertTrue(is_plain_text(text), text)
+        for text in ["", " Leading", "1. List", "**bold**", "a\nb", "<b>x</b>", "a & b", "{~ div ~}"]:
+            self.assertFalse(is_plain_text(text), text)
+
+    def test_plain_text_matches_markdown_output(self):
+        """Test that the plain-text shortcut gives the same HTML as a full parse."""
+        for text in ["Hello world", "It's \"quoted\", a = b + c!", "Trailing space "]:
+            with mock.patch('django_spellbook.markdown.engine.is_plain_text', return_value=False):
+                parsed_html = self.engine.parse_and_render(text)
+            self.assertEqual(self.engine.parse_and_render(text), parsed_html)
+
+    def test_plain_text_shortcut_skipped_for_custom_extensions(self):
+        """Test that custom extension sets always go through python-markdown."""
+        engine = SpellbookMarkdownEngine(
+            reporter=self.reporter, markdown_extensions=['markdown.extensions.smarty']
+        )
+        self.assertEqual(engine.parse_and_render("It's"), "<p>It&rsquo;s</p>")
+
     def test_simple_markdown_rendering(self):
         """Test basic Markdown to HTML conversion without any spellblocks."""
         markdown_text = "# Hello\n\nThis is **bold**."
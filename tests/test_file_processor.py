@@ -1,5 +1,5 @@
 import unittest
-from unittest.mock import Mock, patch, mock_open
+from unittest.mock import Mock, patch
 from pathlib import Path
 import django
 from django.conf import settings
@@ -69,18 +69,26 @@ class TestMarkdownFileProcessor(unittest.TestCase):
             self.processor._validate_and_get_path(dirpath, filename)
 
     @override_settings(SPELLBOOK_MD_PATH='/fake/path')
-    @patch('builtins.open', new_callable=mock_open, read_data="# Test Content")
-    def test_read_markdown_file(self, mock_file):
+    @patch.object(Path, 'read_bytes', autospec=True, return_value="# Test Content".encode('utf-8'))
+    def test_read_markdown_file(self, mock_read_bytes):
         """Test reading markdown file content"""
         test_path = Path("/test/path/test.md")
 
         content = self.processor._read_markdown_file(test_path)
 
         self.assertEqual(content, "# Test Content")
-        mock_file.assert_called_once_with(test_path, 'r', encoding='utf-8')
+        mock_read_bytes.assert_called_once_with(test_path)
 
     @override_settings(SPELLBOOK_MD_PATH='/fake/path')
-    @patch('builtins.open')
+    @patch.object(Path, 'read_bytes', autospec=True, return_value=b"---\r\ntitle: Test\r\n---\r\n# Caf\xc3\xa9\rEnd")
+    def test_read_markdown_file_normalizes_newlines(self, mock_read_bytes):
+        """Test that CRLF and CR line endings are read as newlines"""
+        content = self.processor._read_markdown_file(Path("/test/path/test.md"))
+
+        self.assertEqual(content, "---\ntitle: Test\n---\n# Caf\u00e9\nEnd")
+
+    @override_settings(SPELLBOOK_MD_PATH='/fake/path')
+    @patch.object(Path, 'read_bytes', autospec=True)
     def test_read_markdown_file_error(self, mock_file):
         """Test reading markdown file with error"""
         mock_file.side_effect = IOError("File not found")
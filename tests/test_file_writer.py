@@ -62,6 +62,21 @@ class TestFileWriter(TestCase):
         # Check content
         content = mock_write.call_args[0][1]
         self.assertIn("path('', include('django_spellbook.urls_test_app'))", content)
+
+    @patch('os.path.exists')
+    @patch('builtins.open', new_callable=mock_open)
+    @patch('django_spellbook.management.commands.processing.file_writer.write_file')
+    def test_update_main_urls_file_skips_unchanged(self, mock_write, mock_file, mock_exists):
+        """Test that main urls.py is not rewritten when its content would not change."""
+        mock_exists.return_value = True
+        self.file_writer.url_prefix = 'docs'
+        mock_file.return_value.read.return_value = FileWriter.MAIN_URLS_TEMPLATE.format(
+            includes="path('docs/', include('django_spellbook.urls_test_app'))"
+        )
+
+        self.file_writer._update_main_urls_file()
+
+        mock_write.assert_not_called()
         
     @patch('django_spellbook.management.commands.processing.file_writer.write_file')
     def test_write_urls_file(self, mock_write_file):
@@ -95,7 +110,20 @@ class TestFileWriter(TestCase):
         # Should write to app-specific views.py
         views_file_path = os.path.join(self.file_writer.spellbook_dir, "views_test_app.py")
         mock_write_file.assert_called_once_with(views_file_path, unittest.mock.ANY)
-        
+
+    @patch('django_spellbook.management.commands.processing.file_writer.write_file')
+    def test_write_views_file_skips_unchanged(self, mock_write_file):
+        """Test that views.py is not rewritten when its content would not change."""
+        view_functions = ["def test_view(request):\n    return render(request, 'test.html', {})"]
+        self.file_writer.write_views_file(view_functions, {})
+        content = mock_write_file.call_args[0][1]
+        mock_write_file.reset_mock()
+
+        with patch('builtins.open', mock_open(read_data=content)):
+            self.file_writer.write_views_file(view_functions, {})
+
+        mock_write_file.assert_not_called()
+
         
 import unittest
 from unittest.mock import patch, mock_open, MagicMock
@@ -32,14 +32,28 @@ class TestGeneratorUtils(TestCase):
         self.assertEqual(get_clean_url("test/page"), "test/page")
         self.assertEqual(get_clean_url("--"), "")
         self.assertEqual(get_clean_url(""), "")
-        
+
+    def test_get_clean_url_is_memoized(self):
+        """Repeated URLs are served from the cache."""
+        get_clean_url.cache_clear()
+        get_clean_url("--test/--page")
+        get_clean_url("--test/--page")
+        self.assertEqual(get_clean_url.cache_info().hits, 1)
+
     def test_generate_view_name(self):
         """Test generating valid Python identifier for view name from URL pattern."""
         self.assertEqual(generate_view_name("test/page"), "view_test_page")
         self.assertEqual(generate_view_name("--test/--page"), "view_test_page")
         self.assertEqual(generate_view_name("test-page"), "view_test_page")
         self.assertEqual(generate_view_name("test_page"), "view_test_page")
-        
+
+    def test_generate_view_name_is_memoized(self):
+        """Repeated URL patterns are served from the cache."""
+        generate_view_name.cache_clear()
+        generate_view_name("test/page")
+        generate_view_name("test/page")
+        self.assertEqual(generate_view_name.cache_info().hits, 1)
+
     def test_generate_view_name_with_numeric_paths(self):
         """Test that generate_view_name properly handles numeric paths."""
         self.assertEqual(generate_view_name("0.1.0-release"), "view__0_1_0_release")
@@ -59,30 +73,43 @@ class TestGeneratorUtils(TestCase):
         """Test getting django_spellbook base directory."""
         mock_dirname.return_value = "/fake/path"
         mock_abspath.return_value = "/absolute/fake/path"
+        # The result is cached, so start fresh and don't leak the fake path
+        get_spellbook_dir.cache_clear()
+        self.addCleanup(get_spellbook_dir.cache_clear)
         
         result = get_spellbook_dir()
         
         self.assertEqual(result, "/absolute/fake/path")
+
+        # Later calls reuse the cached directory
+        get_spellbook_dir()
+        mock_abspath.assert_called_once()
         
-    @patch('os.path.exists')
     @patch('os.makedirs')
     @patch('builtins.open', new_callable=mock_open)
-    def test_create_file_if_not_exists(self, mock_file, mock_makedirs, mock_exists):
+    def test_create_file_if_not_exists(self, mock_file, mock_makedirs):
         """Test creating a file when it doesn't exist."""
-        mock_exists.return_value = False
-        
         create_file_if_not_exists("/path/file.py", "content")
         
-        mock_makedirs.assert_called_once_with(os.path.dirname("/path/file.py"), exist_ok=True)
-        mock_file.assert_called_once_with("/path/file.py", 'w')
+        mock_makedirs.assert_not_called()
+        mock_file.assert_called_once_with("/path/file.py", 'x')
         mock_file().write.assert_called_once_with("content")
+
+    @patch('os.makedirs')
+    @patch('builtins.open', new_callable=mock_open)
+    def test_create_file_if_not_exists_existing_file(self, mock_file, mock_makedirs):
+        """Test that an existing file is left alone."""
+        mock_file.side_effect = FileExistsError("exists")
+
+        create_file_if_not_exists("/path/file.py", "content")
+
+        mock_file.assert_called_once_with("/path/file.py", 'x')
+        mock_makedirs.assert_not_called()
         
-    @patch('os.path.exists')
     @patch('os.makedirs')
     @patch('builtins.open')
-    def test_create_file_if_not_exists_error(self, mock_open, mock_makedirs, mock_exists):
+    def test_create_file_if_not_exists_error(self, mock_open, mock_makedirs):
         """Test handling error when creating a file."""
-        mock_exists.return_value = False
         mock_open.side_effect = IOError("Test error")
         
         with self.assertRaises(CommandError) as context:
@@ -96,9 +123,21 @@ class TestGeneratorUtils(TestCase):
         """Test writing content to a file."""
         write_file("/path/file.py", "content")
         
-        mock_makedirs.assert_called_once_with(os.path.dirname("/path/file.py"), exist_ok=True)
+        mock_makedirs.assert_not_called()
         mock_file.assert_called_once_with("/path/file.py", 'w')
         mock_file().write.assert_called_once_with("content")
+
+    @patch('os.makedirs')
+    @patch('builtins.open', new_callable=mock_open)
+    def test_write_file_creates_missing_directory(self, mock_file, mock_makedirs):
+        """Test that the directory is only created when the first open finds it missing."""
+        mock_file.side_effect = [FileNotFoundError("missing"), mock_file.return_value]
+
+        write_file("/path/file.py", "content")
+
+        mock_makedirs.assert_called_once_with(os.path.dirname("/path/file.py"), exist_ok=True)
+        self.assertEqual(mock_file.call_count, 2)
+        mock_file.return_value.write.assert_called_once_with("content")
         
         
 class TestGenerateViewName(TestCase):
@@ -407,3 +407,14 @@ class TestPathBasedNavigation(TestCase):
 
         # Should recognize as namespaced and use as-is
         self.assertEqual(file2.context.prev_page, "blog:---intro")
+
+    def test_index_by_clean_url_keeps_first_match(self):
+        """Test that the URL index uses clean URLs and keeps the first file per URL."""
+        file1 = self._create_processed_file("--intro.md")
+        file2 = self._create_processed_file("intro.md", directory=Path("/test/docs/other"))
+        file3 = self._create_processed_file("setup.md")
+
+        url_index = NavigationBuilder._index_by_clean_url([file1, file2, file3])
+
+        self.assertEqual(set(url_index), {"intro", "setup"})
+        self.assertIs(url_index["intro"], file1)
@@ -1,7 +1,6 @@
 import unittest
 from unittest.mock import patch, Mock
 from django.test import TestCase
-from django.template.loader import render_to_string
 from django_spellbook.blocks import BasicSpellBlock
 
 from django_spellbook.management.commands.spellbook_md_p.reporter import MarkdownReporter
@@ -13,6 +12,8 @@ class TestQuoteBlock(TestCase):
     def setUp(self):
         """Set up test cases with a QuoteBlock instance."""
         from django_spellbook.spellblocks import QuoteBlock
+        BasicSpellBlock._template_cache.clear()
+        self.addCleanup(BasicSpellBlock._template_cache.clear)
         self.BlockClass = QuoteBlock
         self.test_content = "This is a quote"
         self.test_kwargs = {
@@ -48,17 +49,19 @@ class TestQuoteBlock(TestCase):
         expected_output = '<blockquote>Rendered quote with image</blockquote>'
         block = self.BlockClass(MarkdownReporter(StringIO()), self.test_content, **self.test_kwargs)
 
-        # Create mocks for process_content and render_to_string
+        # Create mocks for process_content and template loading
         with patch.object(block, 'process_content', return_value='<p>This is a quote</p>') as mock_process:
-            with patch('django_spellbook.blocks.base.render_to_string', return_value=expected_output) as mock_render:
+            with patch('django_spellbook.blocks.base.get_template') as mock_get_template:
+                mock_render = mock_get_template.return_value.render
+                mock_render.return_value = expected_output
                 rendered_content = block.render()
 
                 # Verify process_content was called
                 mock_process.assert_called_once()
 
-                # Verify render_to_string was called with correct parameters
+                # Verify the template was loaded and rendered with correct parameters
+                mock_get_template.assert_called_once_with('django_spellbook/blocks/quote.html')
                 mock_render.assert_called_once_with(
-                    'django_spellbook/blocks/quote.html',
                     {
                         'content': '<p>This is a quote</p>',
                         'author': 'Test Author',
@@ -78,13 +81,15 @@ class TestQuoteBlock(TestCase):
         kwargs_without_image = {k: v for k, v in self.test_kwargs.items() if k != 'image'}
         block = self.BlockClass(MarkdownReporter(StringIO()), self.test_content, **kwargs_without_image)
 
-        # Create mocks for process_content and render_to_string
+        # Create mocks for process_content and template loading
         with patch.object(block, 'process_content', return_value='<p>This is a quote</p>') as mock_process:
-            with patch('django_spellbook.blocks.base.render_to_string', return_value=expected_output) as mock_render:
+            with patch('django_spellbook.blocks.base.get_template') as mock_get_template:
+                mock_render = mock_get_template.return_value.render
+                mock_render.return_value = expected_output
                 rendered_content = block.render()
 
-                # Verify render_to_string was called without image parameter
-                context = mock_render.call_args[0][1]
+                # Verify the template was rendered without image parameter
+                context = mock_render.call_args[0][0]
                 self.assertEqual(context.get('image', ''), '')
 
                 self.assertEqual(rendered_content, expected_output)
@@ -104,6 +109,8 @@ class TestPracticeBlock(TestCase):
     def setUp(self):
         """Set up test cases with a PracticeBlock instance."""
         from django_spellbook.spellblocks import PracticeBlock
+        BasicSpellBlock._template_cache.clear()
+        self.addCleanup(BasicSpellBlock._template_cache.clear)
         self.BlockClass = PracticeBlock
         self.test_content = "Practice steps\n1. Step one\n2. Step two"
         self.test_kwargs = {
@@ -140,14 +147,16 @@ class TestPracticeBlock(TestCase):
         expected_output = '<div class="practice-block">Rendered practice</div>'
         block = self.BlockClass(MarkdownReporter(StringIO()), self.test_content, **self.test_kwargs)
 
-        # Create mocks for process_content and render_to_string
+        # Create mocks for process_content and template loading
         with patch.object(block, 'process_content', return_value='<p>Practice steps</p><ol><li>Step one</li><li>Step two</li></ol>') as mock_process:
-            with patch('django_spellbook.blocks.base.render_to_string', return_value=expected_output) as mock_render:
+            with patch('django_spellbook.blocks.base.get_template') as mock_get_template:
+                mock_render = mock_get_template.return_value.render
+                mock_render.return_value = expected_output
                 rendered_content = block.render()
 
-                # Verify render_to_string was called with correct parameters
+                # Verify the template was loaded and rendered with correct parameters
+                mock_get_template.assert_called_once_with('django_spellbook/blocks/practice.html')
                 mock_render.assert_called_once_with(
-                    'django_spellbook/blocks/practice.html',
                     {
                         'content': '<p>Practice steps</p><ol><li>Step one</li><li>Step two</li></ol>',
                         'difficulty': 'Advanced',
@@ -226,7 +226,8 @@ class TestURLPrefixEdgeCases(TestCase):
         # Should warn but not raise exception
         self.assertEqual(md_url_prefixes, ['invalid$chars'])
         mock_logger.warning.assert_called_with(
-            "URL prefix 'invalid$chars' contains characters that may cause issues with URL routing."
+            "URL prefix '%s' contains characters that may cause issues with URL routing.",
+            'invalid$chars'
         )
 
     @override_settings(